@@ -19,6 +19,7 @@ import csv
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
@@ -31,6 +32,7 @@ if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
 from forward_model import load_obj  # noqa: E402
+from geometry import pole_separation_deg  # noqa: E402
 from mesh_comparator import compare_meshes  # noqa: E402
 
 # ---------------------------------------------------------------------------
@@ -42,30 +44,8 @@ GROUND_TRUTH_DIR = os.path.join(RESULTS_DIR, "ground_truth")
 BLIND_TESTS_DIR = os.path.join(RESULTS_DIR, "blind_tests")
 OUTPUT_CSV = os.path.join(RESULTS_DIR, "validation_metrics.csv")
 
-
-# ---------------------------------------------------------------------------
-# Helper: angular separation between two ecliptic pole directions
-# ---------------------------------------------------------------------------
-def angular_separation(lam1, bet1, lam2, bet2):
-    """Compute the angular separation (degrees) between two directions
-    given in ecliptic longitude/latitude.
-
-    Parameters
-    ----------
-    lam1, bet1 : float
-        Longitude and latitude of the first direction (degrees).
-    lam2, bet2 : float
-        Longitude and latitude of the second direction (degrees).
-
-    Returns
-    -------
-    float
-        Angular separation in degrees.
-    """
-    lam1, bet1, lam2, bet2 = [np.radians(x) for x in (lam1, bet1, lam2, bet2)]
-    cos_sep = (np.sin(bet1) * np.sin(bet2)
-               + np.cos(bet1) * np.cos(bet2) * np.cos(lam1 - lam2))
-    return float(np.degrees(np.arccos(np.clip(cos_sep, -1.0, 1.0))))
+# Seed for the surface-point sampling of the mesh comparison
+SEED = 42
 
 
 # ---------------------------------------------------------------------------
@@ -78,10 +58,113 @@ def _bounding_box_diagonal(mesh):
     return float(np.linalg.norm(bbox_max - bbox_min))
 
 
+def _list_files(directory):
+    """Return the names of the regular files in *directory*.
+
+    One ``os.scandir`` pass reads the directory once and the entry types come
+    from that read, so the per-file existence checks below need no extra
+    ``stat`` calls.  A missing directory gives an empty set.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+# ---------------------------------------------------------------------------
+# Per-target evaluation
+# ---------------------------------------------------------------------------
+def _evaluate_target(item):
+    """Compute the metrics row for one ``(name, info, seed_seq)`` entry.
+
+    Returns None when the target has no recovered mesh.  Targets share no
+    state and each samples from its own ``SeedSequence`` child, so ``main``
+    maps this over a process pool and the metrics do not depend on which
+    worker ran the target.
+    """
+    name, info, seed_seq = item
+    name_lower = name.lower()
+    target_dir = os.path.join(BLIND_TESTS_DIR, name_lower)
+    target_files = _list_files(target_dir)
+    recovered_obj_path = os.path.join(target_dir, "recovered.obj")
+
+    if "recovered.obj" not in target_files:
+        print(f"[SKIP] {name}: recovered.obj not found at {recovered_obj_path}")
+        return None
+
+    # 2a. Load ground truth mesh
+    gt_obj_path = os.path.join(GROUND_TRUTH_DIR, f"{name_lower}.obj")
+    gt_mesh = load_obj(gt_obj_path)
+
+    # 2b. Load recovered mesh
+    rec_mesh = load_obj(recovered_obj_path)
+
+    # 2c. Load ground truth spin
+    gt_spin_path = os.path.join(GROUND_TRUTH_DIR, f"{name_lower}_spin.json")
+    with open(gt_spin_path, "r") as fh:
+        gt_spin = json.load(fh)
+
+    # 2d. Load recovered spin
+    rec_spin_path = os.path.join(target_dir, "recovered_spin.json")
+    with open(rec_spin_path, "r") as fh:
+        rec_spin = json.load(fh)
+
+    # 2e. Scale recovered mesh to match GT bounding box ----------------
+    gt_diag = _bounding_box_diagonal(gt_mesh)
+    rec_diag = _bounding_box_diagonal(rec_mesh)
+    if rec_diag > 0 and gt_diag > 0:
+        scale = gt_diag / rec_diag
+        from forward_model import TriMesh as _TM
+        scaled_verts = rec_mesh.vertices * scale
+        rec_mesh = _TM(vertices=scaled_verts, faces=rec_mesh.faces,
+                       normals=rec_mesh.normals, areas=rec_mesh.areas * scale**2)
+
+    # 2f. Compare meshes -----------------------------------------------
+    metrics = compare_meshes(gt_mesh, rec_mesh, n_surface_points=10000,
+                             voxel_resolution=64,
+                             rng=np.random.default_rng(seed_seq))
+
+    hausdorff_sym = metrics["hausdorff_symmetric"]
+    bbox_diag = _bounding_box_diagonal(gt_mesh)
+    hausdorff_norm = hausdorff_sym / bbox_diag if bbox_diag > 0 else float("nan")
+    iou = metrics["iou"]
+    chamfer = metrics["chamfer_distance"]
+
+    # 2g. Pole angular error -------------------------------------------
+    pole_error_deg = float(pole_separation_deg(
+        gt_spin["lambda_deg"], gt_spin["beta_deg"],
+        rec_spin["lambda_deg"], rec_spin["beta_deg"],
+    ))
+
+    # 2g. Period error -------------------------------------------------
+    period_error_hr = abs(gt_spin["period_hours"] - rec_spin["period_hours"])
+
+    # 2h. chi2_final from convergence log ------------------------------
+    convergence_path = os.path.join(target_dir, "convergence.json")
+    chi2_final = float("nan")
+    if "convergence.json" in target_files:
+        with open(convergence_path, "r") as fh:
+            convergence = json.load(fh)
+        chi2_final = convergence.get("chi_squared_final",
+                                    convergence.get("chi2_final", float("nan")))
+
+    row = {
+        "target": name,
+        "hausdorff_norm": f"{hausdorff_norm:.6f}",
+        "iou": f"{iou:.6f}",
+        "chamfer": f"{chamfer:.6f}",
+        "pole_error_deg": f"{pole_error_deg:.4f}",
+        "period_error_hr": f"{period_error_hr:.6f}",
+        "chi2_final": f"{chi2_final:.4f}" if not np.isnan(chi2_final) else "nan",
+    }
+    return row
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
-def main():
+def main(max_workers=None):
     # 1. Load benchmark manifest -------------------------------------------
     with open(MANIFEST_PATH, "r") as fh:
         manifest = json.load(fh)
@@ -98,88 +181,15 @@ def main():
         "period_error_hr",
         "chi2_final",
     ]
-    rows = []
-
-    # 2. Iterate over targets ---------------------------------------------
-    for name, info in targets.items():
-        name_lower = name.lower()
-        recovered_obj_path = os.path.join(
-            BLIND_TESTS_DIR, name_lower, "recovered.obj"
-        )
-
-        if not os.path.isfile(recovered_obj_path):
-            print(f"[SKIP] {name}: recovered.obj not found at {recovered_obj_path}")
-            continue
-
-        # 2a. Load ground truth mesh
-        gt_obj_path = os.path.join(GROUND_TRUTH_DIR, f"{name_lower}.obj")
-        gt_mesh = load_obj(gt_obj_path)
-
-        # 2b. Load recovered mesh
-        rec_mesh = load_obj(recovered_obj_path)
-
-        # 2c. Load ground truth spin
-        gt_spin_path = os.path.join(GROUND_TRUTH_DIR, f"{name_lower}_spin.json")
-        with open(gt_spin_path, "r") as fh:
-            gt_spin = json.load(fh)
-
-        # 2d. Load recovered spin
-        rec_spin_path = os.path.join(
-            BLIND_TESTS_DIR, name_lower, "recovered_spin.json"
-        )
-        with open(rec_spin_path, "r") as fh:
-            rec_spin = json.load(fh)
-
-        # 2e. Scale recovered mesh to match GT bounding box ----------------
-        gt_diag = _bounding_box_diagonal(gt_mesh)
-        rec_diag = _bounding_box_diagonal(rec_mesh)
-        if rec_diag > 0 and gt_diag > 0:
-            scale = gt_diag / rec_diag
-            from forward_model import TriMesh as _TM
-            scaled_verts = rec_mesh.vertices * scale
-            rec_mesh = _TM(vertices=scaled_verts, faces=rec_mesh.faces,
-                           normals=rec_mesh.normals, areas=rec_mesh.areas * scale**2)
-
-        # 2f. Compare meshes -----------------------------------------------
-        metrics = compare_meshes(gt_mesh, rec_mesh, n_surface_points=10000,
-                                 voxel_resolution=64)
-
-        hausdorff_sym = metrics["hausdorff_symmetric"]
-        bbox_diag = _bounding_box_diagonal(gt_mesh)
-        hausdorff_norm = hausdorff_sym / bbox_diag if bbox_diag > 0 else float("nan")
-        iou = metrics["iou"]
-        chamfer = metrics["chamfer_distance"]
-
-        # 2g. Pole angular error -------------------------------------------
-        pole_error_deg = angular_separation(
-            gt_spin["lambda_deg"], gt_spin["beta_deg"],
-            rec_spin["lambda_deg"], rec_spin["beta_deg"],
-        )
-
-        # 2g. Period error -------------------------------------------------
-        period_error_hr = abs(gt_spin["period_hours"] - rec_spin["period_hours"])
-
-        # 2h. chi2_final from convergence log ------------------------------
-        convergence_path = os.path.join(
-            BLIND_TESTS_DIR, name_lower, "convergence.json"
-        )
-        chi2_final = float("nan")
-        if os.path.isfile(convergence_path):
-            with open(convergence_path, "r") as fh:
-                convergence = json.load(fh)
-            chi2_final = convergence.get("chi_squared_final",
-                                        convergence.get("chi2_final", float("nan")))
-
-        row = {
-            "target": name,
-            "hausdorff_norm": f"{hausdorff_norm:.6f}",
-            "iou": f"{iou:.6f}",
-            "chamfer": f"{chamfer:.6f}",
-            "pole_error_deg": f"{pole_error_deg:.4f}",
-            "period_error_hr": f"{period_error_hr:.6f}",
-            "chi2_final": f"{chi2_final:.4f}" if not np.isnan(chi2_final) else "nan",
-        }
-        rows.append(row)
+
+    # 2. Evaluate targets in parallel; ex.map keeps manifest order ----------
+    seeds = np.random.SeedSequence(SEED).spawn(len(targets))
+    items = [(name, info, seed_seq)
+             for (name, info), seed_seq in zip(targets.items(), seeds)]
+    if max_workers is None:
+        max_workers = max(1, min(len(items), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        rows = [row for row in ex.map(_evaluate_target, items) if row is not None]
 
     # 3. Write CSV ---------------------------------------------------------
     os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
@@ -18,7 +18,7 @@ from typing import List, Tuple, Optional
 from forward_model import (TriMesh, create_sphere_mesh, compute_brightness,
                            generate_rotation_lightcurve, compute_face_properties,
                            scattering_lambert_lommel)
-from geometry import SpinState, ecliptic_to_body_matrix
+from geometry import SpinState, ecliptic_to_body_matrices
 
 
 @dataclass
@@ -54,13 +54,9 @@ def _precompute_body_dirs(spin, lc_data):
     sun_body : np.ndarray, shape (N, 3)
     obs_body : np.ndarray, shape (N, 3)
     """
-    N = len(lc_data.jd)
-    sun_body = np.zeros((N, 3))
-    obs_body = np.zeros((N, 3))
-    for j in range(N):
-        R = ecliptic_to_body_matrix(spin, lc_data.jd[j])
-        sun_body[j] = R @ lc_data.sun_ecl[j]
-        obs_body[j] = R @ lc_data.obs_ecl[j]
+    R = ecliptic_to_body_matrices(spin, lc_data.jd)  # (N, 3, 3)
+    sun_body = (R @ lc_data.sun_ecl[:, :, None])[:, :, 0]
+    obs_body = (R @ lc_data.obs_ecl[:, :, None])[:, :, 0]
     return sun_body, obs_body
 
 
@@ -124,7 +120,7 @@ def chi_squared(mesh, spin, lightcurves, c_lambert=0.1, reg_weight=0.0,
     for idx, lc in enumerate(lightcurves):
         bd = precomputed_dirs[idx] if precomputed_dirs else None
         model = _compute_model_lc(mesh, spin, lc, c_lambert, body_dirs=bd)
-        if np.all(model == 0):
+        if not model.any():
             chi2 += 1e10
             continue
         # Fit scaling factor: minimize sum w_i (obs_i - c * mod_i)^2
@@ -148,7 +144,8 @@ def chi_squared(mesh, spin, lightcurves, c_lambert=0.1, reg_weight=0.0,
 
 
 def optimize_shape(initial_mesh, spin, lightcurves, c_lambert=0.1,
-                   reg_weight=0.01, max_iter=200, verbose=False):
+                   reg_weight=0.01, max_iter=200, verbose=False,
+                   precomputed_dirs=None):
     """Optimize facet areas to minimize chi-squared at fixed pole and period.
 
     Uses L-BFGS-B optimization on log-areas for non-negativity.
@@ -169,6 +166,9 @@ def optimize_shape(initial_mesh, spin, lightcurves, c_lambert=0.1,
         Maximum optimizer iterations.
     verbose : bool
         Print progress.
+    precomputed_dirs : list of tuple, optional
+        Pre-computed body directions for each lightcurve. Computed from
+        *spin* if None.
 
     Returns
     -------
@@ -184,7 +184,10 @@ def optimize_shape(initial_mesh, spin, lightcurves, c_lambert=0.1,
     vertices = initial_mesh.vertices.copy()
 
     # Pre-compute body directions (spin is fixed, only areas change)
-    precomputed = [_precompute_body_dirs(spin, lc) for lc in lightcurves]
+    if precomputed_dirs is not None:
+        precomputed = precomputed_dirs
+    else:
+        precomputed = [_precompute_body_dirs(spin, lc) for lc in lightcurves]
 
     # Parameterize as log-areas
     log_areas0 = np.log(initial_mesh.areas + 1e-30)
@@ -208,12 +211,10 @@ def optimize_shape(initial_mesh, spin, lightcurves, c_lambert=0.1,
     # adjacent faces, giving a convex shape approximation from the
     # Gaussian image (Kaasalainen & Torppa 2001).
     n_verts = len(vertices)
-    vertex_weight = np.zeros(n_verts)
-    vertex_count = np.zeros(n_verts)
-    for fi, face in enumerate(faces):
-        for vi in face:
-            vertex_weight[vi] += areas_opt[fi]
-            vertex_count[vi] += 1
+    face_verts = faces.ravel()
+    vertex_weight = np.bincount(face_verts, weights=np.repeat(areas_opt, 3),
+                                minlength=n_verts)
+    vertex_count = np.bincount(face_verts, minlength=n_verts).astype(np.float64)
     vertex_count = np.maximum(vertex_count, 1)
     mean_area = np.mean(areas_opt)
     radial_scale = (vertex_weight / vertex_count) / (mean_area + 1e-30)
@@ -285,6 +286,21 @@ def period_search(initial_mesh, base_spin, lightcurves, p_min, p_max, n_periods,
     return best_period, periods, chi2_landscape
 
 
+def _best_pole(grid):
+    """Return the (lambda, beta) of the lowest-chi2 row of a pole grid.
+
+    Matches a running strict ``chi2 < best`` scan started from +inf: the
+    first minimum wins, NaN and +inf entries never win, and ``(0, 0)`` is
+    returned when no trial has a usable chi2.
+    """
+    chi2 = grid[:, 2]
+    usable = chi2 < np.inf
+    if not usable.any():
+        return 0.0, 0.0
+    best_lam, best_bet = grid[np.argmin(np.where(usable, chi2, np.inf)), :2]
+    return best_lam, best_bet
+
+
 def pole_search(initial_mesh, base_spin, lightcurves, n_lambda=12, n_beta=6,
                 c_lambert=0.1, reg_weight=0.01, opt_iter=50, verbose=False):
     """Grid search over pole directions.
@@ -317,29 +333,27 @@ def pole_search(initial_mesh, base_spin, lightcurves, n_lambda=12, n_beta=6,
     lambdas = np.linspace(0, 360, n_lambda, endpoint=False)
     betas = np.linspace(-90, 90, 2 * n_beta + 1)[1::2]  # avoid exact poles
 
-    results = []
-    best_chi2 = np.inf
-    best_lam, best_bet = 0.0, 0.0
-
-    for lam in lambdas:
-        for bet in betas:
-            spin_trial = SpinState(
-                lambda_deg=lam,
-                beta_deg=bet,
-                period_hours=base_spin.period_hours,
-                jd0=base_spin.jd0,
-                phi0=base_spin.phi0
-            )
-            _, chi2, _ = optimize_shape(initial_mesh, spin_trial, lightcurves,
-                                        c_lambert, reg_weight, opt_iter)
-            results.append([lam, bet, chi2])
-            if chi2 < best_chi2:
-                best_chi2 = chi2
-                best_lam, best_bet = lam, bet
-            if verbose:
-                print(f"  Pole ({lam:.0f}, {bet:.0f}): chi2={chi2:.6f}")
-
-    grid = np.array(results)
+    # Trial poles in (lambda outer, beta inner) order; the loop only fills
+    # the chi2 column and the best pole is read off it afterwards
+    grid = np.empty((len(lambdas) * len(betas), 3))
+    grid[:, 0] = np.repeat(lambdas, len(betas))
+    grid[:, 1] = np.tile(betas, len(lambdas))
+
+    for k, (lam, bet) in enumerate(grid[:, :2].tolist()):
+        spin_trial = SpinState(
+            lambda_deg=lam,
+            beta_deg=bet,
+            period_hours=base_spin.period_hours,
+            jd0=base_spin.jd0,
+            phi0=base_spin.phi0
+        )
+        _, chi2, _ = optimize_shape(initial_mesh, spin_trial, lightcurves,
+                                    c_lambert, reg_weight, opt_iter)
+        grid[k, 2] = chi2
+        if verbose:
+            print(f"  Pole ({lam:.0f}, {bet:.0f}): chi2={chi2:.6f}")
+
+    best_lam, best_bet = _best_pole(grid)
     return best_lam, best_bet, grid
 
 
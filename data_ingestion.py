@@ -10,16 +10,32 @@ References:
 """
 
 import os
-import re
 import json
+import stat
+import time
 import numpy as np
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from typing import List, Optional, Tuple
-from forward_model import TriMesh, load_obj, compute_face_properties
+from forward_model import TriMesh, load_obj, parse_obj
 from geometry import SpinState, OrbitalElements
 
 
+# ─── I/O helpers ─────────────────────────────────────────────────────────────
+
+def write_json(path, obj):
+    """Serialise *obj* to *path* as compact JSON in one write.
+
+    The pipeline's JSON outputs are machine-read, so they are written
+    compact: ``json.dumps`` with compact separators runs on the C encoder,
+    whereas ``dump(indent=...)`` falls back to the pure-Python encoder and
+    many small writes, which is slow for long observation and history lists.
+    """
+    with open(path, 'w') as f:
+        f.write(json.dumps(obj, separators=(',', ':')))
+
+
 # ─── Data classes ────────────────────────────────────────────────────────────
 
 @dataclass
@@ -41,15 +57,18 @@ class DenseLightcurve:
 
     @property
     def jd_array(self):
-        return np.array([p.jd for p in self.points])
+        return np.fromiter((p.jd for p in self.points),
+                           dtype=np.float64, count=len(self.points))
 
     @property
     def mag_array(self):
-        return np.array([p.mag for p in self.points])
+        return np.fromiter((p.mag for p in self.points),
+                           dtype=np.float64, count=len(self.points))
 
     @property
     def err_array(self):
-        return np.array([p.mag_err for p in self.points])
+        return np.fromiter((p.mag_err for p in self.points),
+                           dtype=np.float64, count=len(self.points))
 
 
 @dataclass
@@ -75,6 +94,17 @@ class AsteroidData:
 
 # ─── ALCDEF Parsing ──────────────────────────────────────────────────────────
 
+# Metadata keyword -> session field it sets, resolved with one dict lookup
+ALCDEF_METADATA_FIELDS = {
+    'OBJECTNUMBER': 'name',
+    'OBJECTNAME': 'name',
+    'OBSERVERS': 'observer',
+    'FILTER': 'filter',
+}
+
+# Value a session field takes when its keyword is given an empty value
+ALCDEF_METADATA_DEFAULTS = {'name': "", 'observer': "", 'filter': "V"}
+
 def parse_alcdef_string(content):
     """Parse ALCDEF-format data from a string.
 
@@ -94,11 +124,9 @@ def parse_alcdef_string(content):
     lightcurves = []
     lines = content.split('\n')
 
-    current_name = ""
-    current_observer = ""
+    meta = dict(ALCDEF_METADATA_DEFAULTS)
     current_points = []
     in_data = False
-    filter_name = "V"
 
     for line in lines:
         line = line.strip()
@@ -115,9 +143,9 @@ def parse_alcdef_string(content):
             in_data = False
             if current_points:
                 lc = DenseLightcurve(
-                    asteroid_name=current_name,
+                    asteroid_name=meta['name'],
                     points=current_points.copy(),
-                    observer=current_observer
+                    observer=meta['observer']
                 )
                 lightcurves.append(lc)
             current_points = []
@@ -130,23 +158,21 @@ def parse_alcdef_string(content):
             key = key.strip().upper()
             value = value.strip()
 
-            if key == 'OBJECTNUMBER' or key == 'OBJECTNAME':
-                current_name = value
-            elif key == 'OBSERVERS':
-                current_observer = value
-            elif key == 'FILTER':
-                filter_name = value if value else "V"
+            meta_field = ALCDEF_METADATA_FIELDS.get(key)
+            if meta_field is not None:
+                meta[meta_field] = value or ALCDEF_METADATA_DEFAULTS[meta_field]
 
         elif in_data:
-            # Data line: JD|MAG|MAGERR (pipe-delimited)
+            # Data line: JD|MAG|MAGERR (pipe-delimited); float() already
+            # ignores the whitespace around each field
             parts = line.split('|')
             if len(parts) >= 2:
                 try:
-                    jd = float(parts[0].strip())
-                    mag = float(parts[1].strip())
-                    mag_err = float(parts[2].strip()) if len(parts) > 2 else 0.01
+                    jd = float(parts[0])
+                    mag = float(parts[1])
+                    mag_err = float(parts[2]) if len(parts) > 2 else 0.01
                     current_points.append(PhotometryPoint(
-                        jd=jd, mag=mag, mag_err=mag_err, filter_name=filter_name
+                        jd=jd, mag=mag, mag_err=mag_err, filter_name=meta['filter']
                     ))
                 except ValueError:
                     continue
@@ -219,26 +245,7 @@ def parse_damit_shape(obj_content):
     TriMesh
         Parsed mesh.
     """
-    vertices = []
-    faces = []
-    for line in obj_content.split('\n'):
-        parts = line.strip().split()
-        if not parts:
-            continue
-        if parts[0] == 'v' and len(parts) >= 4:
-            vertices.append([float(x) for x in parts[1:4]])
-        elif parts[0] == 'f':
-            face_verts = []
-            for p in parts[1:]:
-                idx = int(p.split('/')[0]) - 1
-                face_verts.append(idx)
-            for k in range(1, len(face_verts) - 1):
-                faces.append([face_verts[0], face_verts[k], face_verts[k+1]])
-
-    vertices = np.array(vertices, dtype=np.float64)
-    faces = np.array(faces, dtype=np.int64)
-    normals, areas = compute_face_properties(vertices, faces)
-    return TriMesh(vertices=vertices, faces=faces, normals=normals, areas=areas)
+    return parse_obj(obj_content)
 
 
 def parse_damit_spin(spin_content):
@@ -279,15 +286,91 @@ def parse_damit_spin(spin_content):
     return SpinState(lambda_deg=lam, beta_deg=beta, period_hours=period, jd0=jd0)
 
 
-def fetch_damit_model(asteroid_id, output_dir="results/ground_truth"):
+# Downloaded DAMIT files are reused for this long before being re-fetched.
+DAMIT_CACHE_MAX_AGE_DAYS = 7.0
+
+# A definitive "no DAMIT model" answer is trusted for a shorter time, since
+# new models are added to the database
+DAMIT_MISSING_MAX_AGE_DAYS = 1.0
+
+
+def _read_cached(path, max_age_days, now=None):
+    """Return the contents of *path* if it exists and is fresh enough.
+
+    Parameters
+    ----------
+    path : str
+        Cached file path.
+    max_age_days : float
+        Maximum age (by modification time) for the file to count as fresh.
+    now : float, optional
+        Reference time (``time.time()`` seconds).  Callers checking several
+        files pass one value so the clock is read once; defaults to now.
+
+    Returns
+    -------
+    str or None
+        File contents, or None if missing or stale.
+    """
+    # One stat() answers both "is it a file" and "how old is it"
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    if now is None:
+        now = time.time()
+    age_days = (now - st.st_mtime) / 86400.0
+    if age_days > max_age_days:
+        return None
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def _damit_model_from_text(asteroid_id, obj_text, spin_text):
+    """Build a ShapeModel from raw DAMIT shape and (optional) spin text."""
+    mesh = parse_damit_shape(obj_text)
+    if spin_text is not None:
+        spin = parse_damit_spin(spin_text)
+    else:
+        spin = SpinState(lambda_deg=0, beta_deg=0, period_hours=0, jd0=2451545.0)
+    return ShapeModel(
+        asteroid_id=asteroid_id,
+        asteroid_name=str(asteroid_id),
+        mesh=mesh,
+        spin=spin,
+        source="DAMIT"
+    )
+
+
+def fetch_damit_model(asteroid_id, output_dir="results/ground_truth",
+                      max_age_days=DAMIT_CACHE_MAX_AGE_DAYS, force_refresh=False,
+                      session=None, missing_max_age_days=DAMIT_MISSING_MAX_AGE_DAYS):
     """Attempt to download a DAMIT shape model and spin parameters.
 
+    Previously downloaded files in *output_dir* are reused while they are
+    younger than *max_age_days*, so repeated runs skip the network.  A
+    definitive "not in DAMIT" answer (404, or an empty 200 response) is
+    remembered for *missing_max_age_days* as an empty
+    ``damit_<id>.missing`` marker file; other failures are not cached.
+
     Parameters
     ----------
     asteroid_id : int
         Asteroid number in DAMIT.
     output_dir : str
         Directory to save downloaded files.
+    max_age_days : float
+        Maximum age of cached files before they are re-downloaded.
+    force_refresh : bool
+        If True, ignore any cached files and always download.
+    session : requests.Session, optional
+        Session to issue the requests on, so the shape and spin downloads
+        (and other targets sharing the session) reuse one keep-alive
+        connection.  Defaults to one-off ``requests.get`` calls.
+    missing_max_age_days : float
+        How long a cached "not in DAMIT" answer is trusted.
 
     Returns
     -------
@@ -296,43 +379,57 @@ def fetch_damit_model(asteroid_id, output_dir="results/ground_truth"):
     """
     os.makedirs(output_dir, exist_ok=True)
 
+    obj_path = os.path.join(output_dir, f"damit_{asteroid_id}.obj")
+    spin_path = os.path.join(output_dir, f"damit_{asteroid_id}_spin.txt")
+    missing_path = os.path.join(output_dir, f"damit_{asteroid_id}.missing")
+
+    if not force_refresh:
+        now = time.time()
+        obj_text = _read_cached(obj_path, max_age_days, now)
+        if obj_text is not None:
+            spin_text = _read_cached(spin_path, max_age_days, now)
+            return _damit_model_from_text(asteroid_id, obj_text, spin_text)
+        if _read_cached(missing_path, missing_max_age_days, now) is not None:
+            return None
+
     # DAMIT model download URL patterns
     base_url = "https://astro.troja.mff.cuni.cz/projects/damit"
     obj_url = f"{base_url}/asteroid_models/view_obj/{asteroid_id}"
     spin_url = f"{base_url}/asteroid_models/view_spin/{asteroid_id}"
 
+    http = requests if session is None else session
+
     try:
         # Download shape
-        resp_obj = requests.get(obj_url, timeout=30)
-        if resp_obj.status_code != 200 or len(resp_obj.text) < 50:
+        resp_obj = http.get(obj_url, timeout=30)
+        not_found = (resp_obj.status_code == 404
+                     or (resp_obj.status_code == 200 and len(resp_obj.text) < 50))
+        if not_found:
             print(f"  DAMIT: shape not found for asteroid {asteroid_id}")
+            try:
+                open(missing_path, 'w').close()
+            except OSError:
+                pass  # the marker only saves a repeat request
+            return None
+        if resp_obj.status_code != 200:
+            print(f"  DAMIT: shape download failed for asteroid {asteroid_id} "
+                  f"(status {resp_obj.status_code})")
             return None
 
         # Download spin
-        resp_spin = requests.get(spin_url, timeout=30)
+        resp_spin = http.get(spin_url, timeout=30)
 
         # Save files
-        obj_path = os.path.join(output_dir, f"damit_{asteroid_id}.obj")
         with open(obj_path, 'w') as f:
             f.write(resp_obj.text)
 
-        mesh = parse_damit_shape(resp_obj.text)
-
+        spin_text = None
         if resp_spin.status_code == 200 and len(resp_spin.text) > 5:
-            spin_path = os.path.join(output_dir, f"damit_{asteroid_id}_spin.txt")
             with open(spin_path, 'w') as f:
                 f.write(resp_spin.text)
-            spin = parse_damit_spin(resp_spin.text)
-        else:
-            spin = SpinState(lambda_deg=0, beta_deg=0, period_hours=0, jd0=2451545.0)
-
-        return ShapeModel(
-            asteroid_id=asteroid_id,
-            asteroid_name=str(asteroid_id),
-            mesh=mesh,
-            spin=spin,
-            source="DAMIT"
-        )
+            spin_text = resp_spin.text
+
+        return _damit_model_from_text(asteroid_id, resp_obj.text, spin_text)
 
     except (requests.RequestException, ConnectionError) as e:
         print(f"  DAMIT download failed for asteroid {asteroid_id}: {e}")
@@ -381,8 +478,7 @@ def generate_synthetic_validation_target(name, asteroid_id, a_axis, b_axis, c_ax
         "period_hours": period_hours, "jd0": 2451545.0
     }
     spin_path = os.path.join(output_dir, f"{name.lower()}_spin.json")
-    with open(spin_path, 'w') as f:
-        json.dump(spin_data, f, indent=2)
+    write_json(spin_path, spin_data)
 
     return ShapeModel(
         asteroid_id=asteroid_id,
@@ -414,17 +510,28 @@ def generate_synthetic_lightcurves(shape_model, n_lightcurves=5, n_points_per_lc
     """
     from forward_model import generate_rotation_lightcurve
 
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     lightcurves = []
 
+    # Draw the viewing geometry and photometric noise for every lightcurve
+    # in three batched calls instead of three small draws per lightcurve
+    sun_draws = rng.standard_normal((n_lightcurves, 3))
+    obs_draws = rng.standard_normal((n_lightcurves, 3))
+    noise_draws = rng.normal(0, 0.005, (n_lightcurves, n_points_per_lc))
+
+    # Every lightcurve samples the same rotation phases (those of
+    # generate_rotation_lightcurve), so the epochs are computed once
+    phases = np.linspace(0, 360, n_points_per_lc, endpoint=False)
+    period_days = shape_model.spin.period_hours / 24.0
+    jd_list = (shape_model.spin.jd0 + phases / 360.0 * period_days).tolist()
+
     for i in range(n_lightcurves):
         # Random viewing geometry
-        sun_ecl = np.random.randn(3)
-        sun_ecl /= np.linalg.norm(sun_ecl)
-        obs_ecl = sun_ecl + 0.1 * np.random.randn(3)
+        sun_ecl = sun_draws[i] / np.linalg.norm(sun_draws[i])
+        obs_ecl = sun_ecl + 0.1 * obs_draws[i]
         obs_ecl /= np.linalg.norm(obs_ecl)
 
-        phases, brightness = generate_rotation_lightcurve(
+        _, brightness = generate_rotation_lightcurve(
             shape_model.mesh, shape_model.spin, sun_ecl, obs_ecl,
             n_points=n_points_per_lc, c_lambert=c_lambert
         )
@@ -433,15 +540,11 @@ def generate_synthetic_lightcurves(shape_model, n_lightcurves=5, n_points_per_lc
         mags = -2.5 * np.log10(np.maximum(brightness, 1e-30))
         mags -= np.mean(mags)
 
-        period_days = shape_model.spin.period_hours / 24.0
-        jd_array = shape_model.spin.jd0 + phases / 360.0 * period_days
-
         # Add small noise
-        noise = np.random.normal(0, 0.005, len(mags))
-        mags += noise
+        mags += noise_draws[i]
 
-        points = [PhotometryPoint(jd=jd_array[j], mag=mags[j], mag_err=0.005)
-                  for j in range(len(mags))]
+        points = [PhotometryPoint(jd=jd, mag=mag, mag_err=0.005)
+                  for jd, mag in zip(jd_list, mags.tolist())]
 
         lc = DenseLightcurve(
             asteroid_name=shape_model.asteroid_name,
@@ -495,7 +598,8 @@ VALIDATION_TARGETS = {
 }
 
 
-def setup_validation_targets(output_dir="results/ground_truth", try_download=True):
+def setup_validation_targets(output_dir="results/ground_truth", try_download=True,
+                             force_refresh=False):
     """Set up validation targets, downloading real data if possible,
     falling back to synthetic data.
 
@@ -504,6 +608,8 @@ def setup_validation_targets(output_dir="results/ground_truth", try_download=Tru
     output_dir : str
     try_download : bool
         If True, attempt to download from DAMIT first.
+    force_refresh : bool
+        If True, re-download DAMIT files even when a fresh cached copy exists.
 
     Returns
     -------
@@ -512,12 +618,27 @@ def setup_validation_targets(output_dir="results/ground_truth", try_download=Tru
     """
     targets = {}
 
+    # Downloads are network-bound, so issue all DAMIT requests at once
+    # rather than paying one round trip per target in sequence, over one
+    # keep-alive session so each connection's TLS handshake is paid once.
+    downloaded = {}
+    if try_download:
+        n_workers = len(VALIDATION_TARGETS)
+        with requests.Session() as session, \
+                ThreadPoolExecutor(max_workers=n_workers) as ex:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=n_workers,
+                                                    pool_maxsize=n_workers)
+            session.mount("https://", adapter)
+            futures = {name: ex.submit(fetch_damit_model, params['id'], output_dir,
+                                       force_refresh=force_refresh,
+                                       session=session)
+                       for name, params in VALIDATION_TARGETS.items()}
+            downloaded = {name: fut.result() for name, fut in futures.items()}
+
     for name, params in VALIDATION_TARGETS.items():
         print(f"Setting up {name} (#{params['id']})...")
 
-        shape_model = None
-        if try_download:
-            shape_model = fetch_damit_model(params['id'], output_dir)
+        shape_model = downloaded.get(name)
 
         if shape_model is None:
             print(f"  Using synthetic data for {name}")
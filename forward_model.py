@@ -15,7 +15,7 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Tuple, Optional, List
 from geometry import (OrbitalElements, SpinState, compute_geometry,
-                      ecliptic_to_body_matrix, spin_axis_vector)
+                      ecliptic_to_body_matrices, spin_axis_vector)
 
 
 @dataclass
@@ -27,6 +27,57 @@ class TriMesh:
     areas: np.ndarray      # (N_f,) face areas
 
 
+def parse_obj(obj_text):
+    """Parse Wavefront .obj content into a TriMesh.
+
+    Vertex and face rows are collected as tokens and converted to arrays in
+    one step; polygons and ``v/vt/vn`` face references fall back to the
+    per-face triangulation loop.
+
+    Parameters
+    ----------
+    obj_text : str
+        OBJ file content.
+
+    Returns
+    -------
+    TriMesh
+        Parsed mesh.
+    """
+    v_rows = []
+    f_rows = []
+    for line in obj_text.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == 'v' and len(parts) >= 4:
+            v_rows.append(parts[1:4])
+        elif parts[0] == 'f':
+            f_rows.append(parts[1:])
+
+    vertices = np.array(v_rows, dtype=np.float64).reshape(-1, 3)
+    try:
+        faces = np.array(f_rows, dtype=np.int64)
+    except ValueError:
+        faces = None  # ragged rows or v/vt/vn references
+    # Only an (N, 3) table is all triangles; quads would still reshape to
+    # three columns whenever 4N is divisible by 3, scrambling the faces
+    if faces is not None and faces.ndim == 2 and faces.shape[1] == 3:
+        faces = faces - 1  # OBJ is 1-indexed
+    else:
+        faces = []
+        for row in f_rows:
+            # Handle vertex/texture/normal format
+            face_verts = [int(p.split('/')[0]) - 1 for p in row]
+            # Triangulate if polygon has >3 vertices
+            for k in range(1, len(face_verts) - 1):
+                faces.append([face_verts[0], face_verts[k], face_verts[k+1]])
+        faces = np.array(faces, dtype=np.int64).reshape(-1, 3)
+
+    normals, areas = compute_face_properties(vertices, faces)
+    return TriMesh(vertices=vertices, faces=faces, normals=normals, areas=areas)
+
+
 def load_obj(filepath):
     """Load a Wavefront .obj file into a TriMesh.
 
@@ -40,29 +91,8 @@ def load_obj(filepath):
     TriMesh
         Loaded mesh.
     """
-    vertices = []
-    faces = []
     with open(filepath, 'r') as f:
-        for line in f:
-            parts = line.strip().split()
-            if not parts:
-                continue
-            if parts[0] == 'v':
-                vertices.append([float(x) for x in parts[1:4]])
-            elif parts[0] == 'f':
-                # Handle vertex/texture/normal format
-                face_verts = []
-                for p in parts[1:]:
-                    idx = int(p.split('/')[0]) - 1  # OBJ is 1-indexed
-                    face_verts.append(idx)
-                # Triangulate if polygon has >3 vertices
-                for k in range(1, len(face_verts) - 1):
-                    faces.append([face_verts[0], face_verts[k], face_verts[k+1]])
-
-    vertices = np.array(vertices, dtype=np.float64)
-    faces = np.array(faces, dtype=np.int64)
-    normals, areas = compute_face_properties(vertices, faces)
-    return TriMesh(vertices=vertices, faces=faces, normals=normals, areas=areas)
+        return parse_obj(f.read())
 
 
 def save_obj(filepath, mesh):
@@ -75,12 +105,13 @@ def save_obj(filepath, mesh):
     mesh : TriMesh
         Mesh to save.
     """
+    # Format every row with one %-operation per block and write once
+    vertices = np.asarray(mesh.vertices, dtype=np.float64)
+    faces = np.asarray(mesh.faces) + 1  # OBJ is 1-indexed
+    v_block = ("v %.8f %.8f %.8f\n" * len(vertices)) % tuple(vertices.ravel().tolist())
+    f_block = ("f %d %d %d\n" * len(faces)) % tuple(faces.ravel().tolist())
     with open(filepath, 'w') as f:
-        f.write("# OBJ file generated by LCI pipeline\n")
-        for v in mesh.vertices:
-            f.write(f"v {v[0]:.8f} {v[1]:.8f} {v[2]:.8f}\n")
-        for face in mesh.faces:
-            f.write(f"f {face[0]+1} {face[1]+1} {face[2]+1}\n")
+        f.write("# OBJ file generated by LCI pipeline\n" + v_block + f_block)
 
 
 def compute_face_properties(vertices, faces):
@@ -149,33 +180,57 @@ def create_sphere_mesh(n_subdivisions=3):
     return TriMesh(vertices=vertices, faces=tri_faces, normals=normals, areas=areas)
 
 
-def _subdivide(vertices, faces):
-    """Subdivide a triangulated mesh by splitting each triangle into 4."""
-    edge_midpoints = {}
-    new_verts = list(vertices)
+def _subdivide(vertices, faces, project=True):
+    """Subdivide a triangulated mesh by splitting each triangle into 4.
 
-    def get_midpoint(i0, i1):
-        edge = (min(i0, i1), max(i0, i1))
-        if edge in edge_midpoints:
-            return edge_midpoints[edge]
-        mid = (vertices[i0] + vertices[i1]) / 2.0
-        mid /= np.linalg.norm(mid)  # project to unit sphere
-        idx = len(new_verts)
-        new_verts.append(mid)
-        edge_midpoints[edge] = idx
-        return idx
+    Shared edges are de-duplicated with ``np.unique`` and midpoints are
+    numbered in order of first appearance (edges ab, bc, ca of each face in
+    turn), so the result matches a face-by-face walk.
 
-    new_faces = []
-    for f in faces:
-        a, b, c = f
-        ab = get_midpoint(a, b)
-        bc = get_midpoint(b, c)
-        ca = get_midpoint(c, a)
-        new_faces.extend([
-            [a, ab, ca], [b, bc, ab], [c, ca, bc], [ab, bc, ca]
-        ])
+    Parameters
+    ----------
+    vertices : np.ndarray, shape (N_v, 3)
+    faces : np.ndarray, shape (N_f, 3)
+    project : bool
+        Project midpoints onto the unit sphere (icosphere construction).
+        Pass False to subdivide arbitrary meshes in place.
 
-    return np.array(new_verts, dtype=np.float64), np.array(new_faces, dtype=np.int64)
+    Returns
+    -------
+    new_vertices : np.ndarray, shape (N_v + N_e, 3)
+    new_faces : np.ndarray, shape (4 * N_f, 3)
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    n_verts = len(vertices)
+
+    a, b, c = faces[:, 0], faces[:, 1], faces[:, 2]
+    # Edges in walk order: (ab, bc, ca) for face 0, then face 1, ...
+    e0 = np.stack([a, b, c], axis=1).ravel()
+    e1 = np.stack([b, c, a], axis=1).ravel()
+    keys = np.minimum(e0, e1) * n_verts + np.maximum(e0, e1)
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+    # Renumber unique edges by first appearance
+    order = np.argsort(first)
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    mid_idx = (n_verts + rank[inverse]).reshape(-1, 3)
+    ab, bc, ca = mid_idx[:, 0], mid_idx[:, 1], mid_idx[:, 2]
+
+    first_edges = first[order]
+    mids = (vertices[e0[first_edges]] + vertices[e1[first_edges]]) / 2.0
+    if project:
+        mids /= np.linalg.norm(mids, axis=1, keepdims=True)
+
+    new_faces = np.stack([
+        np.stack([a, ab, ca], axis=1),
+        np.stack([b, bc, ab], axis=1),
+        np.stack([c, ca, bc], axis=1),
+        np.stack([ab, bc, ca], axis=1),
+    ], axis=1).reshape(-1, 3)
+
+    return np.vstack([vertices, mids]), new_faces
 
 
 def create_ellipsoid_mesh(a_axis, b_axis, c_axis, n_subdivisions=3):
@@ -371,11 +426,13 @@ def generate_rotation_lightcurve(mesh, spin, sun_ecl, obs_ecl, n_points=360,
     period_days = spin.period_hours / 24.0
     jd_array = spin.jd0 + phases_deg / 360.0 * period_days
 
-    brightness = np.zeros(n_points)
-    for j, jd in enumerate(jd_array):
-        R = ecliptic_to_body_matrix(spin, jd)
-        sun_body = R @ sun_ecl
-        obs_body = R @ obs_ecl
-        brightness[j] = compute_brightness(mesh, sun_body, obs_body, c_lambert)
+    # Rotate the fixed ecliptic directions into the body frame at every
+    # phase at once; the brightness sum per phase then only touches the
+    # lit-and-visible facets
+    R = ecliptic_to_body_matrices(spin, jd_array)
+    sun_body = (R @ np.asarray(sun_ecl, dtype=np.float64)[:, None])[:, :, 0]
+    obs_body = (R @ np.asarray(obs_ecl, dtype=np.float64)[:, None])[:, :, 0]
+    brightness = np.array([compute_brightness(mesh, s, o, c_lambert)
+                           for s, o in zip(sun_body, obs_body)], dtype=np.float64)
 
     return phases_deg, brightness
@@ -13,13 +13,14 @@ References:
     Cellino et al. (2009) — evolutionary shape modeling
 """
 
+import heapq
 import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 from forward_model import (TriMesh, create_sphere_mesh, create_ellipsoid_mesh,
                            compute_face_properties, generate_lightcurve_direct,
                            save_obj)
-from geometry import SpinState, ecliptic_to_body_matrix
+from geometry import SpinState, ecliptic_to_body_matrices
 from convex_solver import LightcurveData
 
 
@@ -66,14 +67,9 @@ def _precompute_body_dirs_ga(spin, lightcurves):
     """Pre-compute Sun/observer body-frame directions for all lightcurves."""
     all_dirs = []
     for lc in lightcurves:
-        N = len(lc.jd)
-        sun_body = np.zeros((N, 3))
-        obs_body = np.zeros((N, 3))
-        for j in range(N):
-            R = ecliptic_to_body_matrix(spin, lc.jd[j])
-            sun_body[j] = R @ lc.sun_ecl[j]
-            obs_body[j] = R @ lc.obs_ecl[j]
-        all_dirs.append((sun_body, obs_body))
+        R = ecliptic_to_body_matrices(spin, lc.jd)  # (N, 3, 3)
+        all_dirs.append(((R @ lc.sun_ecl[:, :, None])[:, :, 0],
+                         (R @ lc.obs_ecl[:, :, None])[:, :, 0]))
     return all_dirs
 
 
@@ -97,7 +93,8 @@ def evaluate_fitness(vertices, faces, spin, lightcurves, c_lambert=0.1,
         Fitness value (lower is better).
     """
     normals, areas = compute_face_properties(vertices, faces)
-    if np.any(areas <= 0):
+    # Areas are clamped positive, so only NaN/inf geometry fails this check
+    if not np.all(np.isfinite(areas) & (areas > 0)):
         return 1e20
     mesh = TriMesh(vertices=vertices, faces=faces, normals=normals, areas=areas)
 
@@ -107,16 +104,10 @@ def evaluate_fitness(vertices, faces, spin, lightcurves, c_lambert=0.1,
         if precomputed_dirs is not None:
             sun_body, obs_body = precomputed_dirs[idx]
         else:
-            N = len(lc.jd)
-            sun_body = np.zeros((N, 3))
-            obs_body = np.zeros((N, 3))
-            for j in range(N):
-                R = ecliptic_to_body_matrix(spin, lc.jd[j])
-                sun_body[j] = R @ lc.sun_ecl[j]
-                obs_body[j] = R @ lc.obs_ecl[j]
+            sun_body, obs_body = _precompute_body_dirs_ga(spin, [lc])[0]
 
         model = generate_lightcurve_direct(mesh, sun_body, obs_body, c_lambert)
-        if np.all(model == 0):
+        if not model.any():
             chi2 += 1e10
             continue
 
@@ -131,13 +122,9 @@ def evaluate_fitness(vertices, faces, spin, lightcurves, c_lambert=0.1,
 
     # Regularisation: penalise deviation of edge lengths from their initial mean
     if reg_weight > 0:
-        edge_vecs = []
-        for fi in range(len(faces)):
-            for ei in range(3):
-                v_a = vertices[faces[fi, ei]]
-                v_b = vertices[faces[fi, (ei + 1) % 3]]
-                edge_vecs.append(v_a - v_b)
-        edge_vecs = np.array(edge_vecs)
+        # Edge (ei -> ei+1) of every face, face-major: shape (3*N_f, 3)
+        edge_vecs = (vertices[faces]
+                     - vertices[np.roll(faces, -1, axis=1)]).reshape(-1, 3)
         edge_lens = np.linalg.norm(edge_vecs, axis=1)
         mean_edge = np.mean(edge_lens)
         reg = reg_weight * np.sum((edge_lens - mean_edge) ** 2) / (mean_edge ** 2 + 1e-30)
@@ -146,6 +133,119 @@ def evaluate_fitness(vertices, faces, spin, lightcurves, c_lambert=0.1,
     return chi2
 
 
+# Upper bound on the (candidates x faces x epochs) elements in one batched
+# fitness temporary; about 32 MB of float64 per array.
+FITNESS_BATCH_ELEMENTS = 1 << 22
+
+
+def evaluate_fitness_batch(vertices_batch, faces, spin, lightcurves, c_lambert=0.1,
+                           reg_weight=0.001, precomputed_dirs=None,
+                           chunk_size=None):
+    """Vectorised :func:`evaluate_fitness` over a batch of candidate meshes.
+
+    All candidates share the face topology, so face properties, model
+    lightcurves, scale fits and the edge regulariser are evaluated for a
+    chunk of candidates in single array operations instead of one call per
+    mesh.  Chunking keeps the (chunk, N_f, N) temporaries bounded however
+    large the population, mesh or lightcurves are.
+
+    Parameters
+    ----------
+    vertices_batch : np.ndarray, shape (P, N_v, 3)
+        Vertex positions of the P candidates.
+    faces : np.ndarray, shape (N_f, 3)
+    spin : SpinState
+    lightcurves : list of LightcurveData
+    c_lambert : float
+    reg_weight : float
+    precomputed_dirs : list of (sun_body, obs_body) tuples
+    chunk_size : int or None
+        Candidates evaluated together.  None sizes chunks so one temporary
+        holds at most :data:`FITNESS_BATCH_ELEMENTS` elements.
+
+    Returns
+    -------
+    np.ndarray, shape (P,)
+        Fitness value of each candidate (lower is better).
+    """
+    vertices_batch = np.asarray(vertices_batch, dtype=np.float64)
+    if precomputed_dirs is None:
+        precomputed_dirs = _precompute_body_dirs_ga(spin, lightcurves)
+    if chunk_size is None:
+        n_obs = max((len(lc.jd) for lc in lightcurves), default=1)
+        chunk_size = max(1, FITNESS_BATCH_ELEMENTS // (len(faces) * max(n_obs, 1)))
+
+    n_cand = len(vertices_batch)
+    fitness = np.empty(n_cand)
+    for s in range(0, n_cand, chunk_size):
+        fitness[s:s + chunk_size] = _evaluate_fitness_chunk(
+            vertices_batch[s:s + chunk_size], faces, lightcurves, c_lambert,
+            reg_weight, precomputed_dirs)
+    return fitness
+
+
+def _evaluate_fitness_chunk(vertices_batch, faces, lightcurves, c_lambert,
+                            reg_weight, precomputed_dirs):
+    """Fitness of one chunk of :func:`evaluate_fitness_batch` candidates."""
+    # Face normals and areas for every candidate: (P, N_f, 3) and (P, N_f)
+    v0 = vertices_batch[:, faces[:, 0]]
+    v1 = vertices_batch[:, faces[:, 1]]
+    v2 = vertices_batch[:, faces[:, 2]]
+    cross = np.cross(v1 - v0, v2 - v0)
+    norms = np.maximum(np.linalg.norm(cross, axis=2, keepdims=True), 1e-30)
+    normals = cross / norms
+    areas = 0.5 * norms[..., 0]
+
+    # Candidates failing evaluate_fitness's area check get the same 1e20
+    # without paying for their lightcurves
+    n_cand = len(vertices_batch)
+    plausible = np.all(np.isfinite(areas) & (areas > 0), axis=1)
+    fitness = np.full(n_cand, 1e20)
+    if not plausible.any():
+        return fitness
+    if not plausible.all():
+        vertices_batch = vertices_batch[plausible]
+        normals = normals[plausible]
+        areas = areas[plausible]
+        n_cand = len(vertices_batch)
+
+    chi2 = np.zeros(n_cand)
+    n_total = np.zeros(n_cand)
+    for idx, lc in enumerate(lightcurves):
+        sun_body, obs_body = precomputed_dirs[idx]
+        mu0 = normals @ sun_body.T   # (P, N_f, N)
+        mu = normals @ obs_body.T
+        mask = (mu0 > 0) & (mu > 0)
+        ls = np.where(mask, mu0 / (mu0 + mu + 1e-30), 0.0)
+        lamb = np.where(mask, mu0, 0.0)
+        S = (1 - c_lambert) * ls + c_lambert * lamb
+        model = np.einsum('pfn,pf->pn', S, areas)  # (P, N)
+
+        w = lc.weights
+        c_fit = (model @ (w * lc.brightness)) / ((model**2) @ w + 1e-30)
+        residuals = lc.brightness - c_fit[:, None] * model
+        lc_chi2 = (residuals**2) @ w
+
+        empty = ~model.any(axis=1)
+        chi2 += np.where(empty, 1e10, lc_chi2)
+        n_total += np.where(empty, 0, len(lc.jd))
+
+    chi2 = np.where(n_total > 0, chi2 / np.maximum(n_total, 1), chi2)
+
+    # Regularisation: same edge ordering as evaluate_fitness, (P, 3*N_f)
+    if reg_weight > 0:
+        edge_vecs = (vertices_batch[:, faces]
+                     - vertices_batch[:, np.roll(faces, -1, axis=1)])
+        edge_lens = np.linalg.norm(edge_vecs, axis=-1).reshape(n_cand, -1)
+        mean_edge = edge_lens.mean(axis=1)
+        reg = (reg_weight * np.sum((edge_lens - mean_edge[:, None]) ** 2, axis=1)
+               / (mean_edge ** 2 + 1e-30))
+        chi2 += reg
+
+    fitness[plausible] = chi2
+    return fitness
+
+
 # ---------------------------------------------------------------------------
 # Mutation operators
 # ---------------------------------------------------------------------------
@@ -241,7 +341,7 @@ def crossover(parent_a, parent_b, alpha, rng):
 # Selection
 # ---------------------------------------------------------------------------
 
-def tournament_select(population, tournament_size, rng):
+def tournament_select(population, tournament_size, rng, fitness=None):
     """Select one individual via tournament selection.
 
     Parameters
@@ -249,14 +349,19 @@ def tournament_select(population, tournament_size, rng):
     population : list of Individual
     tournament_size : int
     rng : np.random.Generator
+    fitness : np.ndarray, optional
+        Fitness of each member of *population*.  Pass it when selecting
+        repeatedly from the same population so it is gathered only once.
 
     Returns
     -------
     Individual
-        Winner (lowest fitness).
+        Winner (lowest fitness; the first drawn wins ties).
     """
+    if fitness is None:
+        fitness = np.array([ind.fitness for ind in population])
     indices = rng.choice(len(population), tournament_size, replace=False)
-    best = min(indices, key=lambda i: population[i].fitness)
+    best = indices[np.argmin(fitness[indices])]
     return population[best]
 
 
@@ -340,18 +445,16 @@ def run_genetic_solver(lightcurves, spin, config=None, initial_mesh=None):
     # Compute scale of the mesh for sigma calibration
     mesh_scale = np.max(np.linalg.norm(base_vertices, axis=1))
 
-    # Initialize population
-    population = []
-    for i in range(config.population_size):
-        if i == 0:
-            verts = base_vertices.copy()
-        else:
-            verts = mutate_gaussian(base_vertices,
-                                    config.mutation_sigma * mesh_scale, rng)
-        fitness = evaluate_fitness(verts, faces, spin, lightcurves,
-                                   config.c_lambert, config.reg_weight,
-                                   precomputed)
-        population.append(Individual(vertices=verts, fitness=fitness))
+    # Initialize population (draw every candidate, then score them together)
+    init_verts = [base_vertices.copy()]
+    for i in range(1, config.population_size):
+        init_verts.append(mutate_gaussian(base_vertices,
+                                          config.mutation_sigma * mesh_scale, rng))
+    init_fitness = evaluate_fitness_batch(np.stack(init_verts), faces, spin,
+                                          lightcurves, config.c_lambert,
+                                          config.reg_weight, precomputed)
+    population = [Individual(vertices=verts, fitness=float(fit))
+                  for verts, fit in zip(init_verts, init_fitness)]
 
     # Sort by fitness
     population.sort(key=lambda ind: ind.fitness)
@@ -374,11 +477,16 @@ def run_genetic_solver(lightcurves, spin, config=None, initial_mesh=None):
                 fitness=population[i].fitness
             ))
 
-        # Fill remaining slots
-        while len(new_population) < config.population_size:
+        # Fill remaining slots; fitness does not consume the RNG, so children
+        # are bred first and scored as one batch.
+        children = []
+        fitness = np.array([ind.fitness for ind in population])
+        while len(new_population) + len(children) < config.population_size:
             # Select parents
-            parent_a = tournament_select(population, config.tournament_size, rng)
-            parent_b = tournament_select(population, config.tournament_size, rng)
+            parent_a = tournament_select(population, config.tournament_size,
+                                         rng, fitness)
+            parent_b = tournament_select(population, config.tournament_size,
+                                         rng, fitness)
 
             # Crossover
             if rng.random() < config.crossover_rate:
@@ -391,15 +499,24 @@ def run_genetic_solver(lightcurves, spin, config=None, initial_mesh=None):
             if rng.random() < config.mutation_rate:
                 child_verts = mutate(child_verts, sigma, rng)
 
-            # Evaluate
-            fitness = evaluate_fitness(child_verts, faces, spin, lightcurves,
-                                       config.c_lambert, config.reg_weight,
-                                       precomputed)
-            new_population.append(Individual(vertices=child_verts, fitness=fitness))
-
-        # Sort and update
-        new_population.sort(key=lambda ind: ind.fitness)
-        population = new_population[:config.population_size]
+            children.append(child_verts)
+
+        # Evaluate
+        offspring = []
+        if children:
+            child_fitness = evaluate_fitness_batch(np.stack(children), faces, spin,
+                                                   lightcurves, config.c_lambert,
+                                                   config.reg_weight, precomputed)
+            offspring = sorted((Individual(vertices=verts, fitness=float(fit))
+                                for verts, fit in zip(children, child_fitness)),
+                               key=lambda ind: ind.fitness)
+
+        # The elites are already in fitness order, so only the offspring need
+        # sorting; the stable merge keeps elites ahead of equal-fitness
+        # children exactly as a full sort would.  The loop above fills the
+        # population to exactly population_size, so no truncation is needed.
+        population = list(heapq.merge(new_population, offspring,
+                                      key=lambda ind: ind.fitness))
 
         # Decay mutation sigma
         sigma *= config.mutation_sigma_decay
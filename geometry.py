@@ -183,6 +183,31 @@ def spin_axis_vector(lambda_deg, beta_deg):
                      np.sin(bet)])
 
 
+def pole_separation_deg(lambda1_deg, beta1_deg, lambda2_deg, beta2_deg):
+    """Great-circle angle between pole directions (degrees).
+
+    All arguments broadcast against each other, so scalars, arrays of
+    matched pairs, or outer-product shapes are all accepted.
+
+    Parameters
+    ----------
+    lambda1_deg, beta1_deg : float or np.ndarray
+        Ecliptic longitude and latitude of the first pole(s) (degrees).
+    lambda2_deg, beta2_deg : float or np.ndarray
+        Ecliptic longitude and latitude of the second pole(s) (degrees).
+
+    Returns
+    -------
+    sep : float or np.ndarray
+        Angular separation in degrees, in [0, 180].
+    """
+    lam1, bet1 = np.radians(lambda1_deg), np.radians(beta1_deg)
+    lam2, bet2 = np.radians(lambda2_deg), np.radians(beta2_deg)
+    cos_sep = (np.sin(bet1) * np.sin(bet2)
+               + np.cos(bet1) * np.cos(bet2) * np.cos(lam1 - lam2))
+    return np.degrees(np.arccos(np.clip(cos_sep, -1.0, 1.0)))
+
+
 def ecliptic_to_body_matrix(spin, jd):
     """Compute rotation matrix from ecliptic to body frame at given epoch.
 
@@ -207,6 +232,41 @@ def ecliptic_to_body_matrix(spin, jd):
     return R
 
 
+def ecliptic_to_body_matrices(spin, jd_array):
+    """Stack of ecliptic-to-body rotation matrices for many epochs.
+
+    Vectorised form of :func:`ecliptic_to_body_matrix`: the pole rotation is
+    shared by every epoch and only the spin-phase rotation varies.
+
+    Parameters
+    ----------
+    spin : SpinState
+        Spin state parameters.
+    jd_array : np.ndarray, shape (N,)
+        Julian Dates.
+
+    Returns
+    -------
+    R : np.ndarray, shape (N, 3, 3)
+        Rotation matrix at each epoch.
+    """
+    jd_array = np.asarray(jd_array, dtype=np.float64)
+    lam = np.radians(spin.lambda_deg)
+    bet = np.radians(spin.beta_deg)
+    period_days = spin.period_hours / 24.0
+    phi = spin.phi0 + 2.0 * np.pi / period_days * (jd_array - spin.jd0)
+
+    c, s = np.cos(phi), np.sin(phi)
+    Rz = np.zeros(jd_array.shape + (3, 3))
+    Rz[..., 0, 0] = c
+    Rz[..., 0, 1] = -s
+    Rz[..., 1, 0] = s
+    Rz[..., 1, 1] = c
+    Rz[..., 2, 2] = 1.0
+
+    return Rz @ rotation_matrix_y(np.pi / 2 - bet) @ rotation_matrix_z(-lam)
+
+
 def compute_geometry(ast_elements, spin, jd_array, earth_pos=None):
     """Compute viewing geometry for a set of epochs.
 
@@ -232,7 +292,6 @@ def compute_geometry(ast_elements, spin, jd_array, earth_pos=None):
         'r_geo' : np.ndarray, shape (N,) — Geocentric distance (AU)
     """
     jd_array = np.asarray(jd_array, dtype=np.float64)
-    N = len(jd_array)
 
     # Asteroid heliocentric position
     r_ast = orbital_position(ast_elements, jd_array)
@@ -244,7 +303,8 @@ def compute_geometry(ast_elements, spin, jd_array, earth_pos=None):
         r_earth = np.asarray(earth_pos, dtype=np.float64)
 
     # Direction vectors in ecliptic frame
-    sun_ecl = -r_ast / np.linalg.norm(r_ast, axis=-1, keepdims=True)
+    r_helio = np.linalg.norm(r_ast, axis=-1)
+    sun_ecl = -r_ast / r_helio[..., np.newaxis]
     obs_vec = r_earth - r_ast
     r_geo = np.linalg.norm(obs_vec, axis=-1)
     obs_ecl = obs_vec / r_geo[..., np.newaxis]
@@ -260,15 +320,11 @@ def compute_geometry(ast_elements, spin, jd_array, earth_pos=None):
     cos_asp = np.clip(cos_asp, -1, 1)
     aspect_angle = np.arccos(cos_asp)
 
-    # Transform to body frame
-    sun_body = np.zeros((N, 3))
-    obs_body = np.zeros((N, 3))
-    for j in range(N):
-        R = ecliptic_to_body_matrix(spin, jd_array[j])
-        sun_body[j] = R @ sun_ecl[j]
-        obs_body[j] = R @ obs_ecl[j]
-
-    r_helio = np.linalg.norm(r_ast, axis=-1)
+    # Transform to body frame; the pole rotation and its trigonometry are
+    # evaluated once for all epochs rather than once per epoch
+    R = ecliptic_to_body_matrices(spin, jd_array)
+    sun_body = (R @ sun_ecl[:, :, None])[:, :, 0]
+    obs_body = (R @ obs_ecl[:, :, None])[:, :, 0]
 
     return {
         'sun_body': sun_body,
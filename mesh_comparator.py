@@ -17,7 +17,7 @@ from forward_model import TriMesh, load_obj
 # Surface sampling
 # ---------------------------------------------------------------------------
 
-def sample_surface_points(mesh, n_points=10000):
+def sample_surface_points(mesh, n_points=10000, rng=None):
     """Sample random points uniformly on the surface of a triangle mesh.
 
     For each sample a random triangle is chosen (weighted by area) and a
@@ -30,22 +30,26 @@ def sample_surface_points(mesh, n_points=10000):
         Triangulated mesh with ``vertices``, ``faces``, and ``areas``.
     n_points : int
         Number of surface points to sample.
+    rng : np.random.Generator or int, optional
+        Source of randomness, or a seed for a new Generator.  Defaults to a
+        freshly seeded Generator.
 
     Returns
     -------
     points : np.ndarray, shape (n_points, 3)
         Sampled 3-D surface points.
     """
+    rng = np.random.default_rng(rng)
     areas = mesh.areas
     # Probability of picking each triangle is proportional to its area
     probs = areas / areas.sum()
 
     # Choose which triangle each sample belongs to
-    tri_indices = np.random.choice(len(areas), size=n_points, p=probs)
+    tri_indices = rng.choice(len(areas), size=n_points, p=probs)
 
     # Random barycentric coordinates for each sample
-    r1 = np.random.rand(n_points)
-    r2 = np.random.rand(n_points)
+    r1 = rng.random(n_points)
+    r2 = rng.random(n_points)
     sqrt_r1 = np.sqrt(r1)
     u = 1.0 - sqrt_r1
     v = sqrt_r1 * (1.0 - r2)
@@ -248,25 +252,67 @@ def voxelize_mesh(mesh, resolution=64, bbox_min=None, bbox_max=None):
     v1 = mesh.vertices[mesh.faces[:, 1]]
     v2 = mesh.vertices[mesh.faces[:, 2]]
 
-    # For each xy column cast a ray in +z and collect all intersection z values
+    # For each x row cast +z rays from every y column at once and collect
+    # the intersection z values as a (resolution, F) array (inf = no hit)
     for ix in range(resolution):
-        x = xs[ix]
-        for iy in range(resolution):
-            y = ys[iy]
-            z_hits = _ray_z_hits_for_point(x, y, v0, v1, v2)
-            if len(z_hits) == 0:
-                continue
-            z_hits.sort()
-            # For each voxel z-centre, count how many hits are below it
-            for iz in range(resolution):
-                z = zs[iz]
-                n_below = np.searchsorted(z_hits, z)
-                if n_below % 2 == 1:
-                    voxels[ix, iy, iz] = True
+        z_hits = _ray_z_hits_for_row(xs[ix], ys, v0, v1, v2)
+        iy, fi = np.nonzero(np.isfinite(z_hits))
+        if len(iy) == 0:
+            continue
+        # A hit lies below every voxel z-centre from this index upwards, so
+        # a histogram of start indices cumulated along z gives the number
+        # of hits below each voxel centre
+        iz = np.searchsorted(zs, z_hits[iy, fi], side='right')
+        starts = np.bincount(iy * (resolution + 1) + iz,
+                             minlength=resolution * (resolution + 1))
+        n_below = np.cumsum(starts.reshape(resolution, resolution + 1),
+                            axis=1)[:, :resolution]
+        voxels[ix] = (n_below % 2) == 1
 
     return voxels, bbox_min, bbox_max
 
 
+def _ray_z_hits_for_row(px, ys, v0, v1, v2):
+    """Return z-values of ray-triangle intersections for a row of +z rays.
+
+    Vectorised form of :func:`_ray_z_hits_for_point` over all y positions
+    of a single x row of the voxel grid.
+
+    Parameters
+    ----------
+    px : float
+        x of the ray origins.
+    ys : np.ndarray, shape (R,)
+        y of the ray origins.
+    v0, v1, v2 : np.ndarray, shape (F, 3)
+        Triangle vertex arrays.
+
+    Returns
+    -------
+    z_hits : np.ndarray, shape (R, F)
+        z-coordinate of the intersection of ray *r* with triangle *f*, or
+        ``inf`` where the ray misses the triangle.
+    """
+    ab = v1[:, :2] - v0[:, :2]  # (F, 2)
+    ac = v2[:, :2] - v0[:, :2]
+
+    det = ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]  # (F,)
+    non_degenerate = np.abs(det) > 1e-30
+    inv_det = np.zeros_like(det)
+    inv_det[non_degenerate] = 1.0 / det[non_degenerate]
+
+    ap_x = px - v0[:, 0]                    # (F,)
+    ap_y = ys[:, None] - v0[None, :, 1]     # (R, F)
+
+    u = (ap_x * ac[:, 1] - ap_y * ac[:, 0]) * inv_det
+    v = (ab[:, 0] * ap_y - ab[:, 1] * ap_x) * inv_det
+
+    inside = non_degenerate & (u >= 0) & (v >= 0) & (u + v <= 1.0)
+
+    z_hit = v0[:, 2] + u * (v1[:, 2] - v0[:, 2]) + v * (v2[:, 2] - v0[:, 2])
+    return np.where(inside, z_hit, np.inf)
+
+
 def _ray_z_hits_for_point(px, py, v0, v1, v2):
     """Return z-values of ray-triangle intersections for a single (px, py) ray.
 
@@ -360,7 +406,8 @@ def normalized_hausdorff(hausdorff_dist, mesh):
 # Full comparison
 # ---------------------------------------------------------------------------
 
-def compare_meshes(mesh_a, mesh_b, n_surface_points=10000, voxel_resolution=64):
+def compare_meshes(mesh_a, mesh_b, n_surface_points=10000, voxel_resolution=64,
+                   rng=None):
     """Run a full quantitative comparison between two meshes.
 
     Parameters
@@ -373,6 +420,9 @@ def compare_meshes(mesh_a, mesh_b, n_surface_points=10000, voxel_resolution=64):
         Number of surface sample points per mesh.
     voxel_resolution : int
         Voxel grid resolution.
+    rng : np.random.Generator or int, optional
+        Source of randomness for the surface sampling, or a seed for a new
+        Generator.  Defaults to a freshly seeded Generator.
 
     Returns
     -------
@@ -384,13 +434,18 @@ def compare_meshes(mesh_a, mesh_b, n_surface_points=10000, voxel_resolution=64):
         - ``chamfer_distance`` : Chamfer distance
         - ``iou`` : Volumetric Intersection over Union
     """
-    pts_a = sample_surface_points(mesh_a, n_surface_points)
-    pts_b = sample_surface_points(mesh_b, n_surface_points)
-
-    h_ab = hausdorff_distance(pts_a, pts_b)
-    h_ba = hausdorff_distance(pts_b, pts_a)
+    rng = np.random.default_rng(rng)  # one stream for both meshes
+    pts_a = sample_surface_points(mesh_a, n_surface_points, rng)
+    pts_b = sample_surface_points(mesh_b, n_surface_points, rng)
+
+    # One KD-tree and one nearest-neighbour query per direction serve both
+    # the Hausdorff and Chamfer metrics
+    dist_a_to_b, _ = KDTree(pts_b).query(pts_a)
+    dist_b_to_a, _ = KDTree(pts_a).query(pts_b)
+    h_ab = float(np.max(dist_a_to_b))
+    h_ba = float(np.max(dist_b_to_a))
     h_sym = max(h_ab, h_ba)
-    cd = chamfer_distance(pts_a, pts_b)
+    cd = float(np.mean(dist_a_to_b) + np.mean(dist_b_to_a))
 
     # Shared bounding box for voxelisation
     all_verts = np.vstack([mesh_a.vertices, mesh_b.vertices])
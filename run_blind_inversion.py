@@ -22,6 +22,7 @@ import sys
 import json
 import time
 import signal
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
 from forward_model import (TriMesh, create_sphere_mesh, save_obj,
@@ -30,6 +31,7 @@ from geometry import SpinState, ecliptic_to_body_matrix
 from convex_solver import LightcurveData, run_convex_inversion, optimize_shape
 from hybrid_pipeline import (HybridConfig, HybridResult,
                              run_hybrid_pipeline, run_hybrid_with_known_spin)
+from data_ingestion import write_json
 
 np.random.seed(42)
 
@@ -51,7 +53,7 @@ def load_dense_lightcurves(manifest_target, base_dir="results"):
     Uses orbital parameters (known from ephemeris) to compute ecliptic
     Sun/observer directions. The shape is unknown -- only geometry is used.
     """
-    from geometry import OrbitalElements, compute_geometry
+    from geometry import orbital_position, earth_position_approx
     from setup_benchmark import ORBITAL_PARAMS
 
     name = manifest_target["name"]
@@ -65,16 +67,16 @@ def load_dense_lightcurves(manifest_target, base_dir="results"):
     lightcurves = []
     for lc_file in manifest_target.get("dense_lightcurves", []):
         fpath = os.path.join(base_dir, lc_file)
-        if not os.path.exists(fpath):
+        try:
+            with open(fpath, 'r') as f:
+                lc_data = json.load(f)
+        except FileNotFoundError:
             continue
-        with open(fpath, 'r') as f:
-            lc_data = json.load(f)
 
         jd_array = np.array(lc_data["jd"])
         brightness = np.array(lc_data["brightness"])
         n = len(jd_array)
 
-        from geometry import orbital_position, earth_position_approx
         ast_pos = orbital_position(orbital, jd_array)
         earth_pos = earth_position_approx(jd_array)
 
@@ -155,7 +157,7 @@ def run_blind_test_for_target(name, manifest_target, output_dir):
     # Run with timeout
     signal.signal(signal.SIGALRM, _timeout_handler)
     signal.alarm(300)  # 5 min timeout per target
-    t0 = time.time()
+    t0 = time.perf_counter()
 
     try:
         result = run_hybrid_with_known_spin(lightcurves, spin, config)
@@ -170,7 +172,7 @@ def run_blind_test_for_target(name, manifest_target, output_dir):
             used_ga=False, stage="timeout"
         )
 
-    elapsed = time.time() - t0
+    elapsed = time.perf_counter() - t0
 
     log(f"  Elapsed time: {elapsed:.1f} s")
     log(f"  Recovered period: {result.spin.period_hours:.6f} h")
@@ -193,8 +195,7 @@ def run_blind_test_for_target(name, manifest_target, output_dir):
         "jd0": result.spin.jd0,
     }
     spin_path = os.path.join(output_dir, "recovered_spin.json")
-    with open(spin_path, 'w') as f:
-        json.dump(spin_data, f, indent=2)
+    write_json(spin_path, spin_data)
     log(f"  Saved spin: {spin_path}")
 
     # Save convergence history
@@ -213,8 +214,7 @@ def run_blind_test_for_target(name, manifest_target, output_dir):
             convergence["ga_history"] = result.ga_result.fitness_history
 
     conv_path = os.path.join(output_dir, "convergence.json")
-    with open(conv_path, 'w') as f:
-        json.dump(convergence, f, indent=2)
+    write_json(conv_path, convergence)
     log(f"  Saved convergence: {conv_path}")
 
     # Save log
@@ -237,25 +237,44 @@ def run_blind_test_for_target(name, manifest_target, output_dir):
     }
 
 
-def main():
-    """Run blind inversion tests on all validation targets."""
+def _run_one(item):
+    """Worker entry point: run the blind test for one (name, info) pair.
+
+    Each target is independent and the GA is seeded through its config, so
+    results do not depend on which worker picks the target up.
+    """
+    name, target_info = item
+    out_dir = os.path.join(BLIND_DIR, name.lower())
+    return name, run_blind_test_for_target(name, target_info, out_dir)
+
+
+def main(max_workers=None):
+    """Run blind inversion tests on all validation targets.
+
+    Targets are dispatched to a process pool; ``max_workers`` defaults to
+    one worker per target, capped at the number of available cores.
+    """
     manifest_path = os.path.join(RESULTS_DIR, "benchmark_manifest.json")
     with open(manifest_path, 'r') as f:
         manifest = json.load(f)
 
     os.makedirs(BLIND_DIR, exist_ok=True)
 
+    targets = list(manifest["targets"].items())
+    if max_workers is None:
+        max_workers = max(1, min(len(targets), os.cpu_count() or 1))
+
     all_results = {}
-    for name, target_info in manifest["targets"].items():
-        out_dir = os.path.join(BLIND_DIR, name.lower())
-        result = run_blind_test_for_target(name, target_info, out_dir)
-        if result is not None:
-            all_results[name] = result
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        # ex.map yields in submission order, so the summary keeps the
+        # manifest ordering regardless of completion order.
+        for name, result in ex.map(_run_one, targets):
+            if result is not None:
+                all_results[name] = result
 
     # Save summary
     summary_path = os.path.join(BLIND_DIR, "blind_test_summary.json")
-    with open(summary_path, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    write_json(summary_path, all_results)
 
     print(f"\n{'='*60}")
     print(f"Blind inversion complete: {len(all_results)}/{len(manifest['targets'])} targets")
@@ -15,6 +15,8 @@ import json
 import csv
 import signal
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 from dataclasses import dataclass
 from typing import Optional
@@ -24,14 +26,13 @@ REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, REPO_ROOT)
 
 from sparse_handler import (
-    SparseObservation,
-    SparseDataset,
+    SPARSE_OBS_DTYPE,
     SparseInversionResult,
     create_sparse_lightcurve_data,
     run_sparse_only_inversion,
 )
 from setup_benchmark import ORBITAL_PARAMS
-from geometry import SpinState
+from geometry import SpinState, pole_separation_deg
 
 
 # ---------------------------------------------------------------------------
@@ -61,34 +62,20 @@ N_BETA = 3
 N_SUBDIVISIONS = 1
 C_LAMBERT = 0.1
 
+# One record per (target, data level) run
+RESULT_DTYPE = np.dtype([
+    ("target", "U32"),
+    ("n_sparse", "i8"),
+    ("pole_error_deg", "f8"),
+    ("period_error_hr", "f8"),
+    ("converged", "?"),
+])
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def angular_separation(lam1, bet1, lam2, bet2):
-    """Compute angular separation between two pole directions (degrees).
-
-    Parameters
-    ----------
-    lam1, bet1 : float
-        Ecliptic longitude and latitude of first pole (degrees).
-    lam2, bet2 : float
-        Ecliptic longitude and latitude of second pole (degrees).
-
-    Returns
-    -------
-    float
-        Angular separation in degrees.
-    """
-    lam1, bet1, lam2, bet2 = [np.radians(x) for x in (lam1, bet1, lam2, bet2)]
-    cos_sep = (
-        np.sin(bet1) * np.sin(bet2)
-        + np.cos(bet1) * np.cos(bet2) * np.cos(lam1 - lam2)
-    )
-    return np.degrees(np.arccos(np.clip(cos_sep, -1.0, 1.0)))
-
-
 class TimeoutError(Exception):
     """Raised when an inversion exceeds the allowed wall-clock time."""
     pass
@@ -99,51 +86,125 @@ def _timeout_handler(signum, frame):
 
 
 def load_sparse_observations(json_path):
-    """Load a sparse observation JSON file into a list of dicts.
+    """Load a sparse observation JSON file into a ``SPARSE_OBS_DTYPE`` array.
 
     The JSON file is expected to contain a list of objects, each with keys:
         jd, mag, mag_err, phase_angle_deg, r_helio, r_geo
+
+    The rows are packed into columns once here, so subsampling and
+    inversion set-up never touch the per-observation dicts.
     """
     with open(json_path, "r") as f:
-        return json.load(f)
-
-
-def observations_to_dataset(obs_dicts, target_id=""):
-    """Convert a list of observation dicts to a SparseDataset."""
-    obs_list = []
-    for d in obs_dicts:
-        obs = SparseObservation(
-            jd=d["jd"],
-            mag=d["mag"],
-            mag_err=d["mag_err"],
-            filter_name="V",
-            phase_angle=np.radians(d["phase_angle_deg"]),
-            r_helio=d["r_helio"],
-            r_geo=d["r_geo"],
-        )
-        obs_list.append(obs)
-    return SparseDataset(
-        observations=obs_list, source="benchmark", target_id=target_id
-    )
+        return observations_to_records(json.load(f))
+
 
+def observations_to_records(obs_dicts):
+    """Pack a list of observation dicts into a ``SPARSE_OBS_DTYPE`` array."""
+    records = np.empty(len(obs_dicts), dtype=SPARSE_OBS_DTYPE)
+    records["jd"] = [d["jd"] for d in obs_dicts]
+    records["mag"] = [d["mag"] for d in obs_dicts]
+    records["mag_err"] = [d["mag_err"] for d in obs_dicts]
+    records["phase_angle"] = np.radians([d["phase_angle_deg"] for d in obs_dicts])
+    records["r_helio"] = [d["r_helio"] for d in obs_dicts]
+    records["r_geo"] = [d["r_geo"] for d in obs_dicts]
+    return records
 
-def subsample_observations(obs_dicts, n_points, rng):
-    """Randomly subsample observation dicts to n_points entries.
+
+def subsample_observations(records, n_points, rng):
+    """Randomly subsample observation records to n_points entries.
 
     If the data already has <= n_points observations, return all of them.
     """
-    if len(obs_dicts) <= n_points:
-        return list(obs_dicts)
-    indices = rng.choice(len(obs_dicts), size=n_points, replace=False)
+    if len(records) <= n_points:
+        return records
+    indices = rng.choice(len(records), size=n_points, replace=False)
     indices.sort()  # preserve temporal order
-    return [obs_dicts[i] for i in indices]
+    return records[indices]
+
+
+def _invert_sparse(job):
+    """Worker entry point: run one sparse-only inversion under a timeout.
+
+    *job* is ``(label, lc_data, orbital, p_min, p_max, truth)`` where
+    ``truth`` is ``(lambda_deg, beta_deg, period_hours)``.  Returns
+    ``(pole_error_deg, period_error_hr, converged)``.
+    """
+    label, lc_data, orbital, p_min, p_max, truth = job
+    true_lambda, true_beta, true_period = truth
+
+    converged = True
+    pole_error = float("nan")
+    period_error = float("nan")
+
+    try:
+        # Set alarm-based timeout (POSIX only)
+        old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
+        signal.alarm(TIMEOUT_SEC)
+
+        inv_result = run_sparse_only_inversion(
+            sparse_lc=lc_data,
+            orbital_elements=orbital,
+            p_min=p_min,
+            p_max=p_max,
+            n_periods=N_PERIODS,
+            n_lambda=N_LAMBDA,
+            n_beta=N_BETA,
+            n_subdivisions=N_SUBDIVISIONS,
+            c_lambert=C_LAMBERT,
+            verbose=False,
+        )
+
+        # Cancel alarm
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, old_handler)
+
+        # Compute errors
+        pole_error = pole_separation_deg(
+            inv_result.pole_lambda,
+            inv_result.pole_beta,
+            true_lambda,
+            true_beta,
+        )
+        period_error = abs(inv_result.period_hours - true_period)
+
+        print(
+            f"    [{label}] Recovered: period={inv_result.period_hours:.4f} h, "
+            f"pole=({inv_result.pole_lambda:.1f}, {inv_result.pole_beta:.1f})"
+        )
+        print(
+            f"    [{label}] Errors: pole={pole_error:.2f} deg, "
+            f"period={period_error:.4f} hr"
+        )
+
+    except TimeoutError:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, old_handler)
+        converged = False
+        print(f"    [{label}] TIMEOUT after {TIMEOUT_SEC}s")
+
+    except Exception as exc:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, old_handler)
+        converged = False
+        print(f"    [{label}] ERROR during inversion: {exc}")
+        traceback.print_exc()
+
+    return pole_error, period_error, converged
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
+def main(max_workers=None):
+    """Run the stress test over every (target, data level) pair.
+
+    Subsamples are drawn sequentially so the RNG stream does not depend on
+    scheduling.  Identical subsamples of one target (e.g. every level at or
+    above the number of available points) share a single inversion, and
+    the distinct inversions run in a process pool; ``max_workers`` defaults
+    to the number of available cores.
+    """
     # Load benchmark manifest
     print(f"Loading benchmark manifest from {MANIFEST_PATH}")
     with open(MANIFEST_PATH, "r") as f:
@@ -156,9 +217,13 @@ def main():
         if name not in targets_info:
             print(f"WARNING: target '{name}' not found in manifest, skipping.")
 
-    results = []
     rng = np.random.default_rng(SEED)
 
+    # runs: (target, n_sparse, job index or None) in output order
+    runs = []
+    jobs = []
+    job_index = {}
+
     for target_name in VALIDATION_TARGETS:
         if target_name not in targets_info:
             continue
@@ -187,111 +252,61 @@ def main():
         all_obs = load_sparse_observations(sparse_json_path)
         print(f"  Total sparse observations: {len(all_obs)}")
 
-        for n_sparse in DATA_LEVELS:
-            print(f"\n  [{target_name}] n_sparse={n_sparse}")
+        spin_ref = SpinState(
+            lambda_deg=true_lambda,
+            beta_deg=true_beta,
+            period_hours=true_period,
+            jd0=jd0,
+        )
 
+        for n_sparse in DATA_LEVELS:
             # Subsample
-            sub_obs = subsample_observations(all_obs, n_sparse, rng)
-            actual_n = len(sub_obs)
-            print(f"    Subsampled to {actual_n} points")
-
-            # Build SparseDataset and convert to LightcurveData
-            dataset = observations_to_dataset(sub_obs, target_id=target_name)
-            spin_ref = SpinState(
-                lambda_deg=true_lambda,
-                beta_deg=true_beta,
-                period_hours=true_period,
-                jd0=jd0,
-            )
+            records = subsample_observations(all_obs, n_sparse, rng)
+            actual_n = len(records)
+            print(f"  [{target_name}] n_sparse={n_sparse}: "
+                  f"subsampled to {actual_n} points")
+
+            # Identical subsamples reuse one job
+            key = (target_name, records.tobytes())
+            if key in job_index:
+                runs.append((target_name, actual_n, job_index[key]))
+                continue
+
             try:
-                lc_data = create_sparse_lightcurve_data(dataset, orbital, spin_ref)
+                lc_data = create_sparse_lightcurve_data(records, orbital, spin_ref)
             except Exception as exc:
                 print(f"    ERROR creating LightcurveData: {exc}")
-                results.append({
-                    "target": target_name,
-                    "n_sparse": actual_n,
-                    "pole_error_deg": float("nan"),
-                    "period_error_hr": float("nan"),
-                    "converged": False,
-                })
+                runs.append((target_name, actual_n, None))
                 continue
 
-            # Run sparse-only inversion with timeout
-            converged = True
-            pole_error = float("nan")
-            period_error = float("nan")
-
-            try:
-                # Set alarm-based timeout (POSIX only)
-                old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
-                signal.alarm(TIMEOUT_SEC)
-
-                inv_result = run_sparse_only_inversion(
-                    sparse_lc=lc_data,
-                    orbital_elements=orbital,
-                    p_min=p_min,
-                    p_max=p_max,
-                    n_periods=N_PERIODS,
-                    n_lambda=N_LAMBDA,
-                    n_beta=N_BETA,
-                    n_subdivisions=N_SUBDIVISIONS,
-                    c_lambert=C_LAMBERT,
-                    verbose=False,
-                )
-
-                # Cancel alarm
-                signal.alarm(0)
-                signal.signal(signal.SIGALRM, old_handler)
-
-                # Compute errors
-                pole_error = angular_separation(
-                    inv_result.pole_lambda,
-                    inv_result.pole_beta,
-                    true_lambda,
-                    true_beta,
-                )
-                period_error = abs(inv_result.period_hours - true_period)
-
-                print(
-                    f"    Recovered: period={inv_result.period_hours:.4f} h, "
-                    f"pole=({inv_result.pole_lambda:.1f}, {inv_result.pole_beta:.1f})"
-                )
-                print(
-                    f"    Errors: pole={pole_error:.2f} deg, "
-                    f"period={period_error:.4f} hr"
-                )
-
-            except TimeoutError:
-                signal.alarm(0)
-                signal.signal(signal.SIGALRM, old_handler)
-                converged = False
-                print(f"    TIMEOUT after {TIMEOUT_SEC}s")
-
-            except Exception as exc:
-                signal.alarm(0)
-                signal.signal(signal.SIGALRM, old_handler)
-                converged = False
-                print(f"    ERROR during inversion: {exc}")
-                traceback.print_exc()
-
-            results.append({
-                "target": target_name,
-                "n_sparse": actual_n,
-                "pole_error_deg": pole_error,
-                "period_error_hr": period_error,
-                "converged": converged,
-            })
+            job_index[key] = len(jobs)
+            runs.append((target_name, actual_n, len(jobs)))
+            jobs.append((f"{target_name} n={actual_n}", lc_data, orbital,
+                         p_min, p_max, (true_lambda, true_beta, true_period)))
+
+    # Run the distinct inversions in parallel; ex.map keeps job order
+    print(f"\nRunning {len(jobs)} distinct inversions for {len(runs)} runs")
+    outcomes = []
+    if jobs:
+        if max_workers is None:
+            max_workers = max(1, min(len(jobs), os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            outcomes = list(ex.map(_invert_sparse, jobs))
+
+    results = np.empty(len(runs), dtype=RESULT_DTYPE)
+    for k, (target_name, actual_n, job) in enumerate(runs):
+        if job is None:
+            results[k] = (target_name, actual_n, np.nan, np.nan, False)
+        else:
+            results[k] = (target_name, actual_n) + outcomes[job]
 
     # Write results CSV
     os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
     print(f"\nWriting results to {OUTPUT_CSV}")
     with open(OUTPUT_CSV, "w", newline="") as f:
-        writer = csv.DictWriter(
-            f, fieldnames=["target", "n_sparse", "pole_error_deg",
-                           "period_error_hr", "converged"]
-        )
-        writer.writeheader()
-        for row in results:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_DTYPE.names)
+        for row in results.tolist():
             writer.writerow(row)
 
     # Summary
@@ -19,10 +19,14 @@ References:
 
 import os
 import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from math import radians
+
 import numpy as np
 
 from data_ingestion import (VALIDATION_TARGETS, setup_validation_targets,
-                            generate_synthetic_lightcurves)
+                            generate_synthetic_lightcurves, write_json)
 from geometry import SpinState, OrbitalElements, compute_geometry
 from forward_model import (save_obj, generate_lightcurve_direct,
                            create_sphere_mesh)
@@ -30,69 +34,99 @@ from forward_model import (save_obj, generate_lightcurve_direct,
 
 # Orbital elements (approximate, for synthetic data generation)
 ORBITAL_PARAMS = {
-    "Eros": OrbitalElements(a=1.458, e=0.223, i=np.radians(10.83),
-                             node=np.radians(304.4), peri=np.radians(178.9),
-                             M0=np.radians(190.0), epoch=2451545.0),
-    "Itokawa": OrbitalElements(a=1.324, e=0.280, i=np.radians(1.62),
-                                node=np.radians(69.1), peri=np.radians(162.8),
-                                M0=np.radians(40.0), epoch=2451545.0),
-    "Kleopatra": OrbitalElements(a=2.795, e=0.253, i=np.radians(13.11),
-                                  node=np.radians(215.7), peri=np.radians(179.6),
-                                  M0=np.radians(100.0), epoch=2451545.0),
-    "Gaspra": OrbitalElements(a=2.210, e=0.174, i=np.radians(4.10),
-                               node=np.radians(253.2), peri=np.radians(132.8),
-                               M0=np.radians(60.0), epoch=2451545.0),
-    "Betulia": OrbitalElements(a=2.196, e=0.487, i=np.radians(52.12),
-                                node=np.radians(62.3), peri=np.radians(159.6),
-                                M0=np.radians(250.0), epoch=2451545.0),
+    "Eros": OrbitalElements(a=1.458, e=0.223, i=radians(10.83),
+                             node=radians(304.4), peri=radians(178.9),
+                             M0=radians(190.0), epoch=2451545.0),
+    "Itokawa": OrbitalElements(a=1.324, e=0.280, i=radians(1.62),
+                                node=radians(69.1), peri=radians(162.8),
+                                M0=radians(40.0), epoch=2451545.0),
+    "Kleopatra": OrbitalElements(a=2.795, e=0.253, i=radians(13.11),
+                                  node=radians(215.7), peri=radians(179.6),
+                                  M0=radians(100.0), epoch=2451545.0),
+    "Gaspra": OrbitalElements(a=2.210, e=0.174, i=radians(4.10),
+                               node=radians(253.2), peri=radians(132.8),
+                               M0=radians(60.0), epoch=2451545.0),
+    "Betulia": OrbitalElements(a=2.196, e=0.487, i=radians(52.12),
+                                node=radians(62.3), peri=radians(159.6),
+                                M0=radians(250.0), epoch=2451545.0),
 }
 
 
+def _flux_to_mag(flux):
+    """Return ``-2.5 * log10(max(flux, 1e-30))``.
+
+    The floor, log and scale all run in place on one output buffer rather
+    than allocating a temporary per step.
+    """
+    mags = np.maximum(flux, 1e-30)
+    np.log10(mags, out=mags)
+    mags *= -2.5
+    return mags
+
+
 def generate_dense_lightcurves_from_orbit(shape_model, orbital_elements,
                                            n_lightcurves=5, n_points=60,
                                            c_lambert=0.1, seed=42):
-    """Generate synthetic dense lightcurves using orbital geometry."""
+    """Generate synthetic dense lightcurves using orbital geometry.
+
+    The epochs of all lightcurves are stacked so that the viewing geometry
+    is evaluated in one call, then split back per lightcurve.
+    """
     rng = np.random.default_rng(seed)
     spin = shape_model.spin
 
-    # Generate observations at different orbital phases
-    orbital_period = 365.25 * shape_model.spin.period_hours  # rough
-    lightcurve_data = []
+    # One rotation of dense data; the time offsets are identical for every
+    # lightcurve, only the starting epoch changes.
+    period_days = spin.period_hours / 24.0
+    phases = np.linspace(0, 360, n_points, endpoint=False)
+    dt_rotation = phases / 360.0 * period_days
 
+    # Draw each lightcurve's random epoch in the orbit and its unit-variance
+    # noise in the original interleaved order, so the stream is unchanged
+    base_jds = np.empty(n_lightcurves)
+    unit_noise = np.empty((n_lightcurves, n_points))
     for i in range(n_lightcurves):
-        # Pick a random epoch in the orbit
-        base_jd = orbital_elements.epoch + rng.uniform(0, 365.25 * 2)
-        period_days = spin.period_hours / 24.0
-
-        # One rotation of dense data
-        phases = np.linspace(0, 360, n_points, endpoint=False)
-        jd_array = base_jd + phases / 360.0 * period_days
-
-        # Compute geometry
-        geo = compute_geometry(orbital_elements, spin, jd_array)
-
-        # Compute brightness
-        brightness = generate_lightcurve_direct(
-            shape_model.mesh, geo['sun_body'], geo['obs_body'], c_lambert
-        )
-
-        # Add noise
-        noise_level = 0.005
-        noise = rng.normal(0, noise_level * np.mean(brightness), len(brightness))
-        brightness_noisy = brightness + noise
-
-        # Convert to magnitudes
-        mags = -2.5 * np.log10(np.maximum(brightness_noisy, 1e-30))
-        mags -= np.mean(mags)
+        base_jds[i] = orbital_elements.epoch + rng.uniform(0, 365.25 * 2)
+        unit_noise[i] = rng.standard_normal(n_points)
+    jd_grid = base_jds[:, None] + dt_rotation  # (n_lightcurves, n_points)
+
+    # Geometry for every epoch in one call.  The brightness is still taken
+    # one lightcurve at a time: its (epochs x facets) temporaries stay
+    # cache-resident at n_points rows but not at n_lightcurves * n_points.
+    geo = compute_geometry(orbital_elements, spin, jd_grid.ravel())
+    sun_body = geo['sun_body'].reshape(n_lightcurves, n_points, 3)
+    obs_body = geo['obs_body'].reshape(n_lightcurves, n_points, 3)
+    brightness = np.array([
+        generate_lightcurve_direct(shape_model.mesh, sun_body[i], obs_body[i],
+                                   c_lambert)
+        for i in range(n_lightcurves)
+    ])
+
+    # Noise scaled to each lightcurve's mean brightness, built in place in
+    # the unit-noise buffer
+    noise_level = 0.005
+    brightness_noisy = unit_noise
+    brightness_noisy *= noise_level * brightness.mean(axis=1, keepdims=True)
+    brightness_noisy += brightness
+
+    # Convert to magnitudes
+    mags = _flux_to_mag(brightness_noisy)
+    mags -= mags.mean(axis=1, keepdims=True)
+
+    phase_deg = np.degrees(geo['phase_angle']).reshape(n_lightcurves, n_points)
+    r_helio = geo['r_helio'].reshape(n_lightcurves, n_points)
+    r_geo = geo['r_geo'].reshape(n_lightcurves, n_points)
 
+    lightcurve_data = []
+    for i in range(n_lightcurves):
         lc_data = {
-            "jd": jd_array.tolist(),
-            "mag": mags.tolist(),
-            "mag_err": [0.005] * len(mags),
-            "brightness": brightness_noisy.tolist(),
-            "phase_angle_deg": np.degrees(geo['phase_angle']).tolist(),
-            "r_helio": geo['r_helio'].tolist(),
-            "r_geo": geo['r_geo'].tolist(),
+            "jd": jd_grid[i].tolist(),
+            "mag": mags[i].tolist(),
+            "mag_err": [0.005] * n_points,
+            "brightness": brightness_noisy[i].tolist(),
+            "phase_angle_deg": phase_deg[i].tolist(),
+            "r_helio": r_helio[i].tolist(),
+            "r_geo": r_geo[i].tolist(),
         }
         lightcurve_data.append(lc_data)
 
@@ -110,40 +144,103 @@ def generate_sparse_observations(shape_model, orbital_elements,
     app_spacing = orbital_period_days / n_apparitions
     pts_per_app = n_points // n_apparitions
 
-    jd_list = []
-    for app in range(n_apparitions):
-        base_jd = orbital_elements.epoch + app * app_spacing
-        n_this = pts_per_app if app < n_apparitions - 1 else n_points - len(jd_list)
-        jds = base_jd + rng.uniform(0, 30, n_this)
-        jd_list.extend(sorted(jds.tolist()))
-
-    jd_array = np.array(sorted(jd_list))
+    # pts_per_app epochs in each apparition's 30-day window, the last one
+    # taking the remainder.  One uniform draw yields the same stream as one
+    # draw per apparition.
+    counts = np.full(n_apparitions, pts_per_app)
+    counts[-1] = n_points - pts_per_app * (n_apparitions - 1)
+    base_jds = orbital_elements.epoch + np.arange(n_apparitions) * app_spacing
+    jd_array = np.sort(np.repeat(base_jds, counts) + rng.uniform(0, 30, n_points))
     geo = compute_geometry(orbital_elements, spin, jd_array)
     brightness = generate_lightcurve_direct(
         shape_model.mesh, geo['sun_body'], geo['obs_body'], c_lambert
     )
 
+    # Noise is drawn into the output buffer as unit normals, scaled and
+    # offset by the brightness in place
     noise_level = 0.003
-    noise = rng.normal(0, noise_level * np.mean(brightness), len(brightness))
-    brightness_noisy = brightness + noise
-
-    mags = -2.5 * np.log10(np.maximum(brightness_noisy, 1e-30))
-
-    observations = []
-    for j in range(len(jd_array)):
-        observations.append({
-            "jd": jd_array[j],
-            "mag": mags[j],
-            "mag_err": 0.003,
-            "phase_angle_deg": float(np.degrees(geo['phase_angle'][j])),
-            "r_helio": float(geo['r_helio'][j]),
-            "r_geo": float(geo['r_geo'][j]),
-        })
+    brightness_noisy = rng.standard_normal(len(brightness))
+    brightness_noisy *= noise_level * brightness.mean()
+    brightness_noisy += brightness
+
+    mags = _flux_to_mag(brightness_noisy)
+
+    observations = [
+        {"jd": jd, "mag": mag, "mag_err": 0.003, "phase_angle_deg": phase,
+         "r_helio": r_h, "r_geo": r_g}
+        for jd, mag, phase, r_h, r_g in zip(
+            jd_array.tolist(), mags.tolist(),
+            np.degrees(geo['phase_angle']).tolist(),
+            geo['r_helio'].tolist(), geo['r_geo'].tolist())
+    ]
 
     return observations
 
 
-def setup_benchmark(output_dir="results", try_download=False):
+def _generate_target(item):
+    """Write one ``(name, model, obs_dir)`` target's observation files.
+
+    Targets share no state, so ``setup_benchmark`` maps this over a process
+    pool.  Returns ``(name, target_info)`` for the manifest.
+    """
+    name, model, obs_dir = item
+    stem = name.lower()
+    print(f"\nGenerating benchmark data for {name}...")
+
+    params = VALIDATION_TARGETS[name]
+    orbital = ORBITAL_PARAMS.get(name)
+
+    target_info = {
+        "id": params["id"],
+        "name": name,
+        "ground_truth_obj": os.path.join("ground_truth", f"{stem}.obj"),
+        "spin": {
+            "lambda_deg": params["pole_lambda"],
+            "beta_deg": params["pole_beta"],
+            "period_hours": params["period_hours"],
+            "jd0": 2451545.0,
+        },
+        "axes_km": list(params["axes"]),
+        "n_vertices": int(len(model.mesh.vertices)),
+        "n_faces": int(len(model.mesh.faces)),
+        "source": model.source,
+    }
+
+    # Generate dense lightcurves
+    if orbital is not None:
+        dense_lcs = generate_dense_lightcurves_from_orbit(
+            model, orbital, n_lightcurves=5, n_points=60, seed=42
+        )
+        dense_files = []
+        for i, lc in enumerate(dense_lcs):
+            fname = f"{stem}_dense_lc_{i:02d}.json"
+            fpath = os.path.join(obs_dir, fname)
+            write_json(fpath, lc)
+            dense_files.append(os.path.join("observations", fname))
+        target_info["dense_lightcurves"] = dense_files
+        target_info["n_dense_lc"] = len(dense_files)
+
+        # Generate sparse observations
+        sparse_obs = generate_sparse_observations(
+            model, orbital, n_points=200, n_apparitions=6, seed=42
+        )
+        sparse_fname = f"{stem}_sparse.json"
+        sparse_fpath = os.path.join(obs_dir, sparse_fname)
+        write_json(sparse_fpath, sparse_obs)
+        target_info["sparse_observations"] = os.path.join("observations",
+                                                           sparse_fname)
+        target_info["n_sparse_obs"] = len(sparse_obs)
+    else:
+        target_info["dense_lightcurves"] = []
+        target_info["n_dense_lc"] = 0
+        target_info["sparse_observations"] = None
+        target_info["n_sparse_obs"] = 0
+
+    return name, target_info
+
+
+def setup_benchmark(output_dir="results", try_download=False, force_refresh=False,
+                    max_workers=None):
     """Set up the full validation benchmark suite.
 
     Parameters
@@ -152,6 +249,11 @@ def setup_benchmark(output_dir="results", try_download=False):
         Base output directory.
     try_download : bool
         Attempt to download from DAMIT.
+    force_refresh : bool
+        Ignore cached DAMIT downloads and fetch them again.
+    max_workers : int, optional
+        Worker processes for the per-target data generation; defaults to
+        one per target, capped at the number of available cores.
 
     Returns
     -------
@@ -163,9 +265,10 @@ def setup_benchmark(output_dir="results", try_download=False):
     os.makedirs(gt_dir, exist_ok=True)
     os.makedirs(obs_dir, exist_ok=True)
 
-    # Set up ground truth shapes
+    # 1. Set up ground truth shapes
     targets = setup_validation_targets(output_dir=gt_dir,
-                                        try_download=try_download)
+                                        try_download=try_download,
+                                        force_refresh=force_refresh)
 
     manifest = {
         "version": "1.0",
@@ -173,77 +276,46 @@ def setup_benchmark(output_dir="results", try_download=False):
         "targets": {}
     }
 
-    for name, model in targets.items():
-        print(f"\nGenerating benchmark data for {name}...")
-
-        params = VALIDATION_TARGETS[name]
-        orbital = ORBITAL_PARAMS.get(name)
-
-        target_info = {
-            "id": params["id"],
-            "name": name,
-            "ground_truth_obj": os.path.join("ground_truth", f"{name.lower()}.obj"),
-            "spin": {
-                "lambda_deg": params["pole_lambda"],
-                "beta_deg": params["pole_beta"],
-                "period_hours": params["period_hours"],
-                "jd0": 2451545.0,
-            },
-            "axes_km": list(params["axes"]),
-            "n_vertices": int(len(model.mesh.vertices)),
-            "n_faces": int(len(model.mesh.faces)),
-            "source": model.source,
-        }
-
-        # Generate dense lightcurves
-        if orbital is not None:
-            dense_lcs = generate_dense_lightcurves_from_orbit(
-                model, orbital, n_lightcurves=5, n_points=60, seed=42
-            )
-            dense_files = []
-            for i, lc in enumerate(dense_lcs):
-                fname = f"{name.lower()}_dense_lc_{i:02d}.json"
-                fpath = os.path.join(obs_dir, fname)
-                with open(fpath, 'w') as f:
-                    json.dump(lc, f, indent=2)
-                dense_files.append(os.path.join("observations", fname))
-            target_info["dense_lightcurves"] = dense_files
-            target_info["n_dense_lc"] = len(dense_files)
-
-            # Generate sparse observations
-            sparse_obs = generate_sparse_observations(
-                model, orbital, n_points=200, n_apparitions=6, seed=42
-            )
-            sparse_fname = f"{name.lower()}_sparse.json"
-            sparse_fpath = os.path.join(obs_dir, sparse_fname)
-            with open(sparse_fpath, 'w') as f:
-                json.dump(sparse_obs, f, indent=2)
-            target_info["sparse_observations"] = os.path.join("observations",
-                                                               sparse_fname)
-            target_info["n_sparse_obs"] = len(sparse_obs)
-        else:
-            target_info["dense_lightcurves"] = []
-            target_info["n_dense_lc"] = 0
-            target_info["sparse_observations"] = None
-            target_info["n_sparse_obs"] = 0
-
-        manifest["targets"][name] = target_info
-        print(f"  {name}: {target_info['n_faces']} faces, "
-              f"{target_info['n_dense_lc']} dense LC, "
-              f"{target_info['n_sparse_obs']} sparse obs")
-
-    # Save manifest
+    # 2. Generate each target's observations in parallel; ex.map keeps
+    # the manifest in target order
+    items = [(name, model, obs_dir) for name, model in targets.items()]
+    if max_workers is None:
+        max_workers = max(1, min(len(items), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        for name, target_info in ex.map(_generate_target, items):
+            manifest["targets"][name] = target_info
+            print(f"  {name}: {target_info['n_faces']} faces, "
+                  f"{target_info['n_dense_lc']} dense LC, "
+                  f"{target_info['n_sparse_obs']} sparse obs")
+
+    # 3. Save manifest (small and read by people, so it stays indented)
     manifest_path = os.path.join(output_dir, "benchmark_manifest.json")
     with open(manifest_path, 'w') as f:
-        json.dump(manifest, f, indent=2)
+        f.write(json.dumps(manifest, indent=2))
     print(f"\nBenchmark manifest saved to {manifest_path}")
 
     return manifest
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description="Assemble the validation benchmark suite."
+    )
+    parser.add_argument(
+        "--download",
+        action="store_true",
+        help="Attempt to download ground truth shapes from DAMIT.",
+    )
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Re-download DAMIT files even if a fresh cached copy exists.",
+    )
+    args = parser.parse_args()
+
     np.random.seed(42)
-    manifest = setup_benchmark(output_dir="results", try_download=False)
+    manifest = setup_benchmark(output_dir="results", try_download=args.download,
+                               force_refresh=args.force_refresh)
     print(f"\n{'='*60}")
     print(f"Benchmark suite assembled: {manifest['n_targets']} targets")
     print(f"{'='*60}")
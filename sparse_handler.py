@@ -14,6 +14,7 @@ import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 import csv
+import math
 import os
 
 from geometry import (OrbitalElements, SpinState, compute_geometry,
@@ -22,13 +23,24 @@ from geometry import (OrbitalElements, SpinState, compute_geometry,
 from forward_model import (TriMesh, compute_brightness,
                            generate_lightcurve_direct, create_sphere_mesh)
 from convex_solver import (LightcurveData, chi_squared as dense_chi_squared,
-                           optimize_shape, _precompute_body_dirs)
+                           optimize_shape, _precompute_body_dirs, _best_pole)
 
 
 # ---------------------------------------------------------------------------
 # Data containers
 # ---------------------------------------------------------------------------
 
+# Packed numeric record for one sparse observation (see SparseDataset.to_records)
+SPARSE_OBS_DTYPE = np.dtype([
+    ("jd", "f8"),
+    ("mag", "f8"),
+    ("mag_err", "f8"),
+    ("phase_angle", "f8"),
+    ("r_helio", "f8"),
+    ("r_geo", "f8"),
+])
+
+
 @dataclass
 class SparseObservation:
     """A single sparse photometric observation."""
@@ -53,28 +65,55 @@ class SparseDataset:
         return len(self.observations)
 
     def jd_array(self):
-        return np.array([o.jd for o in self.observations])
+        return np.fromiter((o.jd for o in self.observations),
+                           dtype=np.float64, count=len(self.observations))
 
     def mag_array(self):
-        return np.array([o.mag for o in self.observations])
+        return np.fromiter((o.mag for o in self.observations),
+                           dtype=np.float64, count=len(self.observations))
 
     def mag_err_array(self):
-        return np.array([o.mag_err for o in self.observations])
+        return np.fromiter((o.mag_err for o in self.observations),
+                           dtype=np.float64, count=len(self.observations))
 
     def phase_angle_array(self):
-        return np.array([o.phase_angle for o in self.observations])
+        return np.fromiter((o.phase_angle for o in self.observations),
+                           dtype=np.float64, count=len(self.observations))
 
     def r_helio_array(self):
-        return np.array([o.r_helio for o in self.observations])
+        return np.fromiter((o.r_helio for o in self.observations),
+                           dtype=np.float64, count=len(self.observations))
 
     def r_geo_array(self):
-        return np.array([o.r_geo for o in self.observations])
+        return np.fromiter((o.r_geo for o in self.observations),
+                           dtype=np.float64, count=len(self.observations))
+
+    def to_records(self):
+        """Pack the numeric fields into one structured array.
+
+        Returns
+        -------
+        np.ndarray
+            Array of dtype ``SPARSE_OBS_DTYPE`` with one record per
+            observation, built in a single pass over the list.
+        """
+        return np.fromiter(
+            ((o.jd, o.mag, o.mag_err, o.phase_angle, o.r_helio, o.r_geo)
+             for o in self.observations),
+            dtype=SPARSE_OBS_DTYPE, count=len(self.observations))
 
 
 # ---------------------------------------------------------------------------
 # H-G phase curve model  (IAU standard, Bowell et al. 1989)
 # ---------------------------------------------------------------------------
 
+def _tan_half(alpha):
+    """Return tan(alpha / 2) with alpha / 2 clipped to [0, pi/2)."""
+    alpha = np.asarray(alpha, dtype=np.float64)
+    half = np.clip(alpha / 2.0, 0.0, np.pi / 2.0 - 1e-10)
+    return np.tan(half)
+
+
 def _phi1(alpha):
     """Compute phi1 basis function for H-G model.
 
@@ -88,10 +127,7 @@ def _phi1(alpha):
     phi1 : np.ndarray
         phi1 values.
     """
-    alpha = np.asarray(alpha, dtype=np.float64)
-    half = np.clip(alpha / 2.0, 0.0, np.pi / 2.0 - 1e-10)
-    tan_half = np.tan(half)
-    return np.exp(-3.33 * tan_half ** 0.63)
+    return np.exp(-3.33 * _tan_half(alpha) ** 0.63)
 
 
 def _phi2(alpha):
@@ -107,10 +143,18 @@ def _phi2(alpha):
     phi2 : np.ndarray
         phi2 values.
     """
-    alpha = np.asarray(alpha, dtype=np.float64)
-    half = np.clip(alpha / 2.0, 0.0, np.pi / 2.0 - 1e-10)
-    tan_half = np.tan(half)
-    return np.exp(-1.87 * tan_half ** 1.22)
+    return np.exp(-1.87 * _tan_half(alpha) ** 1.22)
+
+
+def _hg_basis(alpha):
+    """Return ``(phi1, phi2)`` from a single clipped ``tan(alpha / 2)``.
+
+    Both basis functions depend on alpha only through the half-angle
+    tangent, so the phase curve models share it instead of evaluating the
+    clip and tangent once per basis function.
+    """
+    tan_half = _tan_half(alpha)
+    return np.exp(-3.33 * tan_half ** 0.63), np.exp(-1.87 * tan_half ** 1.22)
 
 
 def hg_phase_function(alpha, H, G):
@@ -133,8 +177,7 @@ def hg_phase_function(alpha, H, G):
         Predicted reduced magnitude V(1, 1, alpha).
     """
     alpha = np.asarray(alpha, dtype=np.float64)
-    p1 = _phi1(alpha)
-    p2 = _phi2(alpha)
+    p1, p2 = _hg_basis(alpha)
     combined = G * p1 + (1.0 - G) * p2
     # Guard against log of zero/negative
     combined = np.maximum(combined, 1e-30)
@@ -185,8 +228,7 @@ def hg12_phase_function(alpha, H, G1, G2):
         Predicted reduced magnitude V(1, 1, alpha).
     """
     alpha = np.asarray(alpha, dtype=np.float64)
-    p1 = _phi1(alpha)
-    p2 = _phi2(alpha)
+    p1, p2 = _hg_basis(alpha)
     p3 = _phi3(alpha)
     G3 = 1.0 - G1 - G2
     combined = G1 * p1 + G2 * p2 + G3 * p3
@@ -310,19 +352,20 @@ def parse_gaia_sso_csv(filepath):
                     mag_err = (2.5 / np.log(10)) * abs(flux_err / max(flux, 1e-30))
                     mag_err = max(mag_err, 0.001)
 
-                    # Compute distances and phase angle from positions
-                    ast_pos = np.array([float(row['x']), float(row['y']),
-                                        float(row['z'])])
-                    earth_pos = np.array([float(row['x_earth']),
-                                          float(row['y_earth']),
-                                          float(row['z_earth'])])
-                    r_helio = np.linalg.norm(ast_pos)
-                    obs_vec = earth_pos - ast_pos
-                    r_geo = np.linalg.norm(obs_vec)
-                    sun_dir = -ast_pos / max(r_helio, 1e-30)
-                    obs_dir = obs_vec / max(r_geo, 1e-30)
-                    cos_alpha = np.clip(np.dot(sun_dir, obs_dir), -1, 1)
-                    phase_angle = np.arccos(cos_alpha)
+                    # Compute distances and phase angle from positions.
+                    # Scalar math on the three components: per-row 3-element
+                    # NumPy arrays cost far more in call overhead than the
+                    # arithmetic itself.
+                    x, y, z = float(row['x']), float(row['y']), float(row['z'])
+                    ox = float(row['x_earth']) - x
+                    oy = float(row['y_earth']) - y
+                    oz = float(row['z_earth']) - z
+                    r_helio = math.hypot(x, y, z)
+                    r_geo = math.hypot(ox, oy, oz)
+                    # Sun direction is -ast_pos
+                    cos_alpha = (-(x * ox + y * oy + z * oz)
+                                 / (max(r_helio, 1e-30) * max(r_geo, 1e-30)))
+                    phase_angle = math.acos(min(max(cos_alpha, -1.0), 1.0))
 
                     obs = SparseObservation(
                         jd=jd, mag=mag, mag_err=mag_err,
@@ -434,8 +477,9 @@ def create_sparse_lightcurve_data(sparse_data, orbital_elements, spin):
 
     Parameters
     ----------
-    sparse_data : SparseDataset
-        Parsed sparse observations.
+    sparse_data : SparseDataset or np.ndarray
+        Parsed sparse observations, either as a dataset or as a structured
+        array of dtype ``SPARSE_OBS_DTYPE``.
     orbital_elements : OrbitalElements
         Asteroid orbital elements.
     spin : SpinState
@@ -446,12 +490,14 @@ def create_sparse_lightcurve_data(sparse_data, orbital_elements, spin):
     LightcurveData
         Sparse observations in the format expected by convex_solver.
     """
-    if sparse_data.n_obs == 0:
+    records = (sparse_data.to_records()
+               if isinstance(sparse_data, SparseDataset) else sparse_data)
+    if len(records) == 0:
         raise ValueError("SparseDataset contains no observations.")
 
-    jd = sparse_data.jd_array()
-    mags = sparse_data.mag_array()
-    mag_errs = sparse_data.mag_err_array()
+    jd = records["jd"].copy()
+    mags = records["mag"]
+    mag_errs = records["mag_err"]
 
     # Compute geometry from orbital elements
     geo = compute_geometry(orbital_elements, spin, jd)
@@ -525,7 +571,7 @@ def sparse_chi_squared(mesh, spin, sparse_lc, c_lambert=0.1):
     sun_body, obs_body = _precompute_body_dirs(spin, sparse_lc)
     model = generate_lightcurve_direct(mesh, sun_body, obs_body, c_lambert)
 
-    if np.all(model == 0):
+    if not model.any():
         return 1e10, len(sparse_lc.jd)
 
     # Fit global scaling factor
@@ -577,7 +623,7 @@ def combined_chi_squared(mesh, spin, dense_lcs, sparse_lc,
         for lc in dense_lcs:
             sun_body, obs_body = _precompute_body_dirs(spin, lc)
             model = generate_lightcurve_direct(mesh, sun_body, obs_body, c_lambert)
-            if np.all(model == 0):
+            if not model.any():
                 chi2_dense += 1e10
                 continue
             w = lc.weights
@@ -670,7 +716,7 @@ def optimize_combined(initial_mesh, spin, dense_lcs, sparse_lc,
         for idx, lc in enumerate(dense_lcs):
             sb, ob = dense_precomputed[idx]
             model = generate_lightcurve_direct(mesh, sb, ob, c_lambert)
-            if np.all(model == 0):
+            if not model.any():
                 chi2_d += 1e10
                 continue
             w = lc.weights
@@ -687,7 +733,7 @@ def optimize_combined(initial_mesh, spin, dense_lcs, sparse_lc,
         if sparse_body_dirs is not None:
             sb, ob = sparse_body_dirs
             model = generate_lightcurve_direct(mesh, sb, ob, c_lambert)
-            if not np.all(model == 0):
+            if model.any():
                 w = sparse_lc.weights
                 c_fit = np.sum(w * sparse_lc.brightness * model) / (
                     np.sum(w * model ** 2) + 1e-30)
@@ -757,23 +803,32 @@ def phase_dispersion_minimization(jd, mag, p_min, p_max, n_periods=500):
         return (p_min + p_max) / 2, periods_h, np.ones(n_periods)
 
     n_bins = 10
-    pdm_values = np.zeros(n_periods)
-
-    for idx, period_h in enumerate(periods_h):
-        period_days = period_h / 24.0
-        phases = ((jd - jd[0]) / period_days) % 1.0
-        bin_edges = np.linspace(0, 1, n_bins + 1)
-        bin_var_sum = 0.0
-        n_in_bins = 0
-        for b in range(n_bins):
-            mask = (phases >= bin_edges[b]) & (phases < bin_edges[b + 1])
-            if np.sum(mask) > 1:
-                bin_var_sum += np.var(mag[mask]) * np.sum(mask)
-                n_in_bins += np.sum(mask)
-        if n_in_bins > 0:
-            pdm_values[idx] = (bin_var_sum / n_in_bins) / total_var
-        else:
-            pdm_values[idx] = 1.0
+    bin_edges = np.linspace(0, 1, n_bins + 1)
+
+    # Fold at every trial period at once: (n_periods, N) phases, each mapped
+    # to its bin with the same half-open [edge_b, edge_b+1) test as a mask.
+    period_days = periods_h / 24.0
+    phases = ((jd - jd[0])[None, :] / period_days[:, None]) % 1.0
+    bins = np.searchsorted(bin_edges, phases, side='right') - 1
+
+    # Flat (period, bin) cell index so every cell is reduced by one bincount
+    n_cells = n_periods * n_bins
+    cells = (np.arange(n_periods)[:, None] * n_bins + bins).ravel()
+    mag_flat = np.broadcast_to(mag, phases.shape).ravel()
+    counts = np.bincount(cells, minlength=n_cells)
+    sums = np.bincount(cells, weights=mag_flat, minlength=n_cells)
+    means = sums / np.maximum(counts, 1)
+    # count * var == sum of squared deviations about the bin mean
+    sq_dev = np.bincount(cells, weights=(mag_flat - means[cells]) ** 2,
+                         minlength=n_cells)
+
+    # Only bins holding more than one point contribute
+    used = counts > 1
+    bin_var_sum = np.where(used, sq_dev, 0.0).reshape(n_periods, n_bins).sum(axis=1)
+    n_in_bins = np.where(used, counts, 0).reshape(n_periods, n_bins).sum(axis=1)
+    pdm_values = np.ones(n_periods)
+    has_bins = n_in_bins > 0
+    pdm_values[has_bins] = (bin_var_sum[has_bins] / n_in_bins[has_bins]) / total_var
 
     best_idx = np.argmin(pdm_values)
     return periods_h[best_idx], periods_h, pdm_values
@@ -821,30 +876,28 @@ def sparse_pole_search(sparse_lc, orbital_elements, period_hours,
     lambdas = np.linspace(0, 360, n_lambda, endpoint=False)
     betas = np.linspace(-90, 90, 2 * n_beta + 1)[1::2]
 
-    results = []
-    best_chi2 = np.inf
-    best_lam, best_bet = 0.0, 0.0
-
-    for lam in lambdas:
-        for bet in betas:
-            spin_trial = SpinState(
-                lambda_deg=lam, beta_deg=bet,
-                period_hours=period_hours, jd0=sparse_lc.jd[0]
-            )
-            # Optimise shape (areas only) against sparse data
-            _, chi2, _ = optimize_shape(
-                sphere, spin_trial, [sparse_lc],
-                c_lambert=c_lambert, reg_weight=reg_weight,
-                max_iter=max_iter, verbose=False
-            )
-            results.append([lam, bet, chi2])
-            if chi2 < best_chi2:
-                best_chi2 = chi2
-                best_lam, best_bet = lam, bet
-            if verbose:
-                print(f"  Pole ({lam:.0f}, {bet:.0f}): chi2={chi2:.6f}")
-
-    grid = np.array(results)
+    # Trial poles in (lambda outer, beta inner) order; the loop only fills
+    # the chi2 column and the best pole is read off it afterwards
+    grid = np.empty((len(lambdas) * len(betas), 3))
+    grid[:, 0] = np.repeat(lambdas, len(betas))
+    grid[:, 1] = np.tile(betas, len(lambdas))
+
+    for k, (lam, bet) in enumerate(grid[:, :2].tolist()):
+        spin_trial = SpinState(
+            lambda_deg=lam, beta_deg=bet,
+            period_hours=period_hours, jd0=sparse_lc.jd[0]
+        )
+        # Optimise shape (areas only) against sparse data
+        _, chi2, _ = optimize_shape(
+            sphere, spin_trial, [sparse_lc],
+            c_lambert=c_lambert, reg_weight=reg_weight,
+            max_iter=max_iter, verbose=False
+        )
+        grid[k, 2] = chi2
+        if verbose:
+            print(f"  Pole ({lam:.0f}, {bet:.0f}): chi2={chi2:.6f}")
+
+    best_lam, best_bet = _best_pole(grid)
     return best_lam, best_bet, grid
 
 
@@ -43,15 +43,12 @@ Usage
 """
 
 import csv
+import heapq
 import os
-import random
 import argparse
 from pathlib import Path
 
-# ---------------------------------------------------------------------------
-# Reproducibility
-# ---------------------------------------------------------------------------
-random.seed(42)
+import numpy as np
 
 # ---------------------------------------------------------------------------
 # Internal asteroid database
@@ -351,7 +348,12 @@ def passes_priority_4(ast):
 
 
 def passes_all_criteria(ast):
-    """Return True only if the asteroid passes ALL four priority filters."""
+    """Return True only if the asteroid passes ALL four priority filters.
+
+    Selection itself runs on :func:`criteria_masks`; this per-asteroid form
+    is kept as the readable reference the vectorised masks are tested
+    against.
+    """
     return (
         passes_priority_1(ast)
         and passes_priority_2(ast)
@@ -360,6 +362,56 @@ def passes_all_criteria(ast):
     )
 
 
+# Numeric catalogue fields as NumPy columns (structure-of-arrays view of
+# the list-of-dicts database); integer counts are held as float64 so the
+# scoring divisions match the scalar functions exactly.
+CATALOGUE_DTYPE = np.dtype([
+    ("neo_flag", bool),
+    ("diameter_km", np.float64),
+    ("lcdb_quality", np.float64),
+    ("in_damit", bool),
+    ("num_dense_lc", np.float64),
+    ("num_sparse_pts", np.float64),
+    ("num_apparitions", np.float64),
+])
+
+
+def catalogue_table(asteroids):
+    """Gather the numeric fields of *asteroids* into a record array.
+
+    Returns
+    -------
+    np.ndarray
+        Array of dtype :data:`CATALOGUE_DTYPE`, one row per asteroid.
+    """
+    return np.fromiter(
+        ((a["neo_flag"], a["diameter_km"], a["lcdb_quality"], a["in_damit"],
+          a["num_dense_lc"], a["num_sparse_pts"], a["num_apparitions"])
+         for a in asteroids),
+        dtype=CATALOGUE_DTYPE, count=len(asteroids))
+
+
+def criteria_masks(table):
+    """Vectorised :func:`passes_priority_1` .. :func:`passes_priority_4`.
+
+    Parameters
+    ----------
+    table : np.ndarray
+        Catalogue record array from :func:`catalogue_table`.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Boolean pass masks ``(p1, p2, p3, p4)``.
+    """
+    p1 = table["neo_flag"] | (table["diameter_km"] > 100.0)
+    p2 = table["lcdb_quality"] >= 2
+    p3 = ~table["in_damit"]
+    p4 = ((table["num_dense_lc"] > 20)
+          | ((table["num_sparse_pts"] > 100) & (table["num_apparitions"] > 3)))
+    return p1, p2, p3, p4
+
+
 def compute_priority_score(ast):
     """
     Compute a composite priority score for ranking candidates.
@@ -403,6 +455,38 @@ def compute_priority_score(ast):
     return round(priority_score, 2)
 
 
+def compute_priority_scores(asteroids):
+    """
+    Vectorised :func:`compute_priority_score` for a list of asteroids.
+
+    The scoring formula is evaluated over the columns of
+    :func:`catalogue_table` (or a table passed directly) in one pass.
+    Each term is computed with the same operations in the same order as
+    the scalar version, so the scores are identical.
+
+    Returns
+    -------
+    list of float
+        Composite priority score of each asteroid, in input order.
+    """
+    table = asteroids
+    if not isinstance(table, np.ndarray):
+        table = catalogue_table(asteroids)
+    neo = table["neo_flag"]
+    diam = table["diameter_km"]
+    quality = table["lcdb_quality"]
+    dense = table["num_dense_lc"]
+    sparse = table["num_sparse_pts"]
+
+    neo_score = np.where(neo, 3.0, 0.0)
+    size_score = np.where(diam > 100.0, 2.0, np.where(diam > 50.0, 1.0, 0.0))
+    data_score = np.minimum(dense / 10.0, 3.0) + np.minimum(sparse / 100.0, 3.0)
+
+    priority_score = neo_score + size_score + quality + data_score
+    # Python's round() keeps the scalar function's exact rounding
+    return [round(v, 2) for v in priority_score.tolist()]
+
+
 # ---------------------------------------------------------------------------
 # Main pipeline
 # ---------------------------------------------------------------------------
@@ -415,21 +499,27 @@ def select_candidates(top_n=50):
     -----
     1. Filter the internal database through all four Boolean criteria.
     2. Compute the priority score for each surviving candidate.
-    3. Sort descending by priority_score (ties broken by designation).
-    4. Return the top-N rows.
+    3. Select the top-N by descending priority_score (ties broken by
+       designation) with a bounded heap instead of a full sort.
     """
-    # Step 1 -- Boolean filtering
-    candidates = [ast for ast in ASTEROID_DB if passes_all_criteria(ast)]
+    # Step 1 -- Boolean filtering over the catalogue columns
+    table = catalogue_table(ASTEROID_DB)
+    p1, p2, p3, p4 = criteria_masks(table)
+    passing = p1 & p2 & p3 & p4
+    candidates = [ASTEROID_DB[i] for i in np.flatnonzero(passing).tolist()]
 
     # Step 2 -- Scoring
-    for ast in candidates:
-        ast["priority_score"] = compute_priority_score(ast)
-
-    # Step 3 -- Sort: highest score first; ties broken alphabetically
-    candidates.sort(key=lambda a: (-a["priority_score"], a["designation"]))
-
-    # Step 4 -- Trim to top-N
-    return candidates[:top_n]
+    for ast, score in zip(candidates, compute_priority_scores(table[passing])):
+        ast["priority_score"] = score
+
+    # Step 3 -- Top-N: highest score first; ties broken alphabetically.
+    # heapq.nsmallest is O(N log top_n) and returns the same ordered list as
+    # sorting everything and slicing.  np.argpartition on the scores alone
+    # would not honour the designation tie-break at the top_n boundary.
+    return heapq.nsmallest(
+        top_n, candidates,
+        key=lambda a: (-a["priority_score"], a["designation"]),
+    )
 
 
 def write_csv(candidates, output_path):
@@ -484,16 +574,19 @@ def main():
         output_path = args.output
 
     # --- Report database statistics ---
+    # Each criterion is evaluated once per asteroid as a column mask; the
+    # per-criterion failures and the all-criteria count are mask sums.
     total = len(ASTEROID_DB)
-    passing = [a for a in ASTEROID_DB if passes_all_criteria(a)]
+    p1, p2, p3, p4 = criteria_masks(catalogue_table(ASTEROID_DB))
+    fail_p1 = int(np.count_nonzero(~p1))
+    fail_p2 = int(np.count_nonzero(~p2))
+    fail_p3 = int(np.count_nonzero(~p3))
+    fail_p4 = int(np.count_nonzero(~p4))
+    n_passing = int(np.count_nonzero(p1 & p2 & p3 & p4))
     print("Internal database : {} asteroids".format(total))
-    print("Pass all criteria : {}".format(len(passing)))
+    print("Pass all criteria : {}".format(n_passing))
 
     # --- Diagnostics: show how many fail each criterion ---
-    fail_p1 = sum(1 for a in ASTEROID_DB if not passes_priority_1(a))
-    fail_p2 = sum(1 for a in ASTEROID_DB if not passes_priority_2(a))
-    fail_p3 = sum(1 for a in ASTEROID_DB if not passes_priority_3(a))
-    fail_p4 = sum(1 for a in ASTEROID_DB if not passes_priority_4(a))
     print("  Fail Priority 1 (NEO or >100km)   : {}".format(fail_p1))
     print("  Fail Priority 2 (U >= 2)          : {}".format(fail_p2))
     print("  Fail Priority 3 (not in DAMIT)    : {}".format(fail_p3))
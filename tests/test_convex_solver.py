@@ -14,7 +14,7 @@ from forward_model import (create_ellipsoid_mesh, create_sphere_mesh,
                            generate_rotation_lightcurve)
 from geometry import SpinState, ecliptic_to_body_matrix
 from convex_solver import (LightcurveData, optimize_shape, chi_squared,
-                           period_search)
+                           period_search, pole_search, _best_pole)
 
 np.random.seed(42)
 
@@ -127,12 +127,52 @@ def test_period_search_finds_correct_period():
     print("PASS: Period search finds correct period")
 
 
+def test_pole_search_grid():
+    """Pole search fills one (lambda, beta, chi2) row per trial pole."""
+    print("\nTest: Pole search grid")
+
+    true_mesh = create_ellipsoid_mesh(1.5, 1.0, 0.9, n_subdivisions=1)
+    true_spin = SpinState(lambda_deg=90, beta_deg=45, period_hours=6.0,
+                          jd0=2451545.0)
+    lightcurves = make_synthetic_lightcurves(true_mesh, true_spin, n_lcs=2,
+                                            n_points=24, c_lambert=0.1)
+
+    sphere = create_sphere_mesh(n_subdivisions=1)
+    best_lam, best_bet, grid = pole_search(
+        sphere, true_spin, lightcurves, n_lambda=4, n_beta=2,
+        c_lambert=0.1, reg_weight=0.001, opt_iter=10
+    )
+
+    assert grid.shape == (4 * 2, 3), f"Unexpected grid shape {grid.shape}"
+    assert np.all(np.isfinite(grid)), "Grid contains non-finite values"
+    best_row = grid[np.argmin(grid[:, 2])]
+    assert (best_row[0], best_row[1]) == (best_lam, best_bet), \
+        "Best pole does not match the grid minimum"
+    print("PASS: Pole search grid is complete and consistent")
+
+
+def test_best_pole_skips_non_finite():
+    """NaN/+inf chi2 never win the pole grid; no usable entry gives (0, 0)."""
+    grid = np.array([[0.0, 15.0, np.nan],
+                     [30.0, 45.0, 2.0],
+                     [60.0, -45.0, 1.0],
+                     [90.0, 15.0, 1.0],
+                     [120.0, 45.0, np.inf]])
+    assert _best_pole(grid) == (60.0, -45.0)
+
+    grid[:, 2] = [np.nan, np.inf, np.nan, np.inf, np.nan]
+    assert _best_pole(grid) == (0.0, 0.0)
+    print("PASS: Best pole ignores non-finite chi2")
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Convex Solver Tests")
     print("=" * 60)
     test_shape_optimization_convergence()
     test_period_search_finds_correct_period()
+    test_pole_search_grid()
+    test_best_pole_skips_non_finite()
     print("=" * 60)
     print("ALL TESTS PASSED")
     print("=" * 60)
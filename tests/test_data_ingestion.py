@@ -9,13 +9,15 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import json
 import numpy as np
 import tempfile
+import time
 from data_ingestion import (
     parse_alcdef_string, parse_damit_shape, parse_damit_spin,
     generate_synthetic_validation_target, generate_synthetic_lightcurves,
     setup_validation_targets, VALIDATION_TARGETS, PhotometryPoint,
-    DenseLightcurve
+    DenseLightcurve, fetch_damit_model, write_json
 )
 from forward_model import save_obj
 
@@ -50,6 +52,9 @@ ENDDATA
     assert len(lightcurves[0].points) == 5, f"Expected 5 points, got {len(lightcurves[0].points)}"
     assert len(lightcurves[1].points) == 3, f"Expected 3 points, got {len(lightcurves[1].points)}"
     assert lightcurves[0].asteroid_name in ("433", "Eros")
+    assert lightcurves[0].observer == "Test Observer"
+    assert lightcurves[0].points[0].filter_name == "V"
+    assert lightcurves[1].points[0].filter_name == "R"
 
     # Check parsed values
     assert abs(lightcurves[0].points[0].jd - 2451545.5) < 1e-10
@@ -91,6 +96,127 @@ def test_parse_damit_spin():
     print("PASS: DAMIT spin parsing")
 
 
+def test_fetch_damit_model_uses_cache():
+    """Fresh cached DAMIT files are parsed without touching the network."""
+    obj_content = """v 1.0 0.0 0.0
+v 0.0 1.0 0.0
+v 0.0 0.0 1.0
+v 0.0 0.0 0.0
+f 1 2 3
+f 1 2 4
+f 1 3 4
+f 2 3 4
+"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with open(os.path.join(tmpdir, "damit_999.obj"), 'w') as f:
+            f.write(obj_content)
+        with open(os.path.join(tmpdir, "damit_999_spin.txt"), 'w') as f:
+            f.write("45.0 30.0 6.0 2451545.0")
+
+        model = fetch_damit_model(999, output_dir=tmpdir)
+        assert model is not None, "Cached model was not loaded"
+        assert model.mesh.faces.shape == (4, 3)
+        assert abs(model.spin.period_hours - 6.0) < 1e-10
+    print("PASS: DAMIT cache reuse")
+
+
+def test_fetch_damit_model_uses_session():
+    """Shape and spin downloads are issued on the supplied session."""
+    class _Response:
+        def __init__(self, text):
+            self.status_code = 200
+            self.text = text
+
+    class _Session:
+        def __init__(self):
+            self.urls = []
+
+        def get(self, url, timeout=None):
+            self.urls.append(url)
+            if "view_spin" in url:
+                return _Response("45.0 30.0 6.0 2451545.0")
+            return _Response("v 1 0 0\nv 0 1 0\nv 0 0 1\nv 0 0 0\n"
+                             "f 1 2 3\nf 1 2 4\nf 1 3 4\nf 2 3 4\n")
+
+    session = _Session()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model = fetch_damit_model(999, output_dir=tmpdir, session=session)
+        assert model is not None, "Downloaded model was not parsed"
+        assert model.mesh.faces.shape == (4, 3)
+        assert abs(model.spin.period_hours - 6.0) < 1e-10
+    assert len(session.urls) == 2, f"Expected 2 requests, got {session.urls}"
+    print("PASS: DAMIT download via shared session")
+
+
+def test_fetch_damit_model_caches_missing():
+    """A "not in DAMIT" answer is remembered and not re-requested."""
+    class _NotFound:
+        status_code = 404
+        text = ""
+
+    class _Session:
+        def __init__(self):
+            self.n_calls = 0
+
+        def get(self, url, timeout=None):
+            self.n_calls += 1
+            return _NotFound()
+
+    session = _Session()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert fetch_damit_model(999, output_dir=tmpdir, session=session) is None
+        assert fetch_damit_model(999, output_dir=tmpdir, session=session) is None
+        assert session.n_calls == 1, f"Expected 1 request, got {session.n_calls}"
+
+        fetch_damit_model(999, output_dir=tmpdir, session=session,
+                          force_refresh=True)
+        assert session.n_calls == 2, "force_refresh did not bypass the cache"
+    print("PASS: DAMIT missing-model cache")
+
+
+def test_fetch_damit_model_does_not_cache_errors():
+    """Transient server errors are retried, and the missing marker expires."""
+    class _Unavailable:
+        status_code = 503
+        text = ""
+
+    class _NotFound:
+        status_code = 404
+        text = ""
+
+    class _Session:
+        def __init__(self, response):
+            self.response = response
+            self.n_calls = 0
+
+        def get(self, url, timeout=None):
+            self.n_calls += 1
+            return self.response
+
+    session = _Session(_Unavailable())
+    with tempfile.TemporaryDirectory() as tmpdir:
+        assert fetch_damit_model(999, output_dir=tmpdir, session=session) is None
+        assert fetch_damit_model(999, output_dir=tmpdir, session=session) is None
+        assert session.n_calls == 2, "A 503 response was cached"
+        assert not os.path.exists(os.path.join(tmpdir, "damit_999.missing"))
+
+        # A 404 marker older than the negative TTL is ignored
+        session = _Session(_NotFound())
+        fetch_damit_model(999, output_dir=tmpdir, session=session)
+        marker = os.path.join(tmpdir, "damit_999.missing")
+        stale = time.time() - 2 * 86400.0
+        os.utime(marker, (stale, stale))
+        fetch_damit_model(999, output_dir=tmpdir, session=session)
+        assert session.n_calls == 2, "Expired missing marker was still honoured"
+
+    # An unwritable marker still gives the "not found" None, not an OSError
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.mkdir(os.path.join(tmpdir, "damit_999.missing"))
+        assert fetch_damit_model(999, output_dir=tmpdir,
+                                 session=_Session(_NotFound())) is None
+    print("PASS: DAMIT errors not cached")
+
+
 def test_synthetic_validation_targets():
     """Test synthetic validation target generation for >= 3 asteroids."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -151,6 +277,20 @@ def test_dense_lightcurve_properties():
     print("PASS: DenseLightcurve properties")
 
 
+def test_write_json_round_trip():
+    """write_json writes compact JSON that reads back unchanged."""
+    obj = {"jd": [2451545.0, 2451545.25], "name": "Eros", "n": 3,
+           "nested": {"flag": True, "value": None}}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "out.json")
+        write_json(path, obj)
+        with open(path) as f:
+            text = f.read()
+    assert json.loads(text) == obj
+    assert " " not in text and "\n" not in text
+    print("PASS: write_json round trip")
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Data Ingestion Tests")
@@ -158,7 +298,12 @@ if __name__ == '__main__':
     test_parse_alcdef_string()
     test_parse_damit_shape()
     test_parse_damit_spin()
+    test_fetch_damit_model_uses_cache()
+    test_fetch_damit_model_uses_session()
+    test_fetch_damit_model_caches_missing()
+    test_fetch_damit_model_does_not_cache_errors()
     test_dense_lightcurve_properties()
+    test_write_json_round_trip()
     test_synthetic_lightcurve_generation()
     test_synthetic_validation_targets()
     print("=" * 60)
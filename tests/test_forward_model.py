@@ -5,6 +5,10 @@ Validates:
 1. Sphere lightcurve is flat/constant
 2. Ellipsoid amplitude matches a/b ratio within 2%
 3. Kepler equation solver accuracy
+4. Pole separation (scalar and broadcast)
+5. Mesh subdivision shares edge midpoints
+6. Stacked body-frame rotations match the per-epoch matrix
+7. OBJ quad and mixed faces are fan-triangulated
 """
 
 import sys
@@ -12,10 +16,13 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import numpy as np
+import tempfile
 from forward_model import (create_sphere_mesh, create_ellipsoid_mesh,
                            generate_rotation_lightcurve, compute_brightness,
-                           TriMesh, compute_face_properties)
-from geometry import SpinState, solve_kepler
+                           TriMesh, compute_face_properties, _subdivide,
+                           save_obj, load_obj, parse_obj)
+from geometry import (SpinState, solve_kepler, pole_separation_deg,
+                      ecliptic_to_body_matrix, ecliptic_to_body_matrices)
 
 np.random.seed(42)
 
@@ -36,6 +43,34 @@ def test_kepler_solver():
     print("PASS: Kepler solver")
 
 
+def test_pole_separation():
+    """Pole separation matches known angles, scalar and broadcast alike."""
+    assert abs(pole_separation_deg(0.0, 90.0, 123.0, 90.0)) < 1e-6
+    assert abs(pole_separation_deg(0.0, 0.0, 90.0, 0.0) - 90.0) < 1e-10
+    assert abs(pole_separation_deg(10.0, 20.0, 190.0, -20.0) - 180.0) < 1e-6
+
+    lams = np.array([0.0, 45.0, 180.0, 300.0])
+    bets = np.array([10.0, -30.0, 60.0, 0.0])
+    seps = pole_separation_deg(lams, bets, 30.0, 15.0)
+    assert seps.shape == (4,)
+    for i in range(4):
+        assert abs(seps[i] - pole_separation_deg(lams[i], bets[i],
+                                                 30.0, 15.0)) < 1e-10
+    print("PASS: Pole separation")
+
+
+def test_body_matrices_match_single_epoch():
+    """Stacked rotation matrices equal the per-epoch ecliptic_to_body_matrix."""
+    spin = SpinState(lambda_deg=123.0, beta_deg=-35.0, period_hours=7.3,
+                     jd0=2451545.0)
+    jd = 2451545.0 + np.linspace(0.0, 3.0, 17)
+    R = ecliptic_to_body_matrices(spin, jd)
+    assert R.shape == (len(jd), 3, 3)
+    for j in range(len(jd)):
+        assert np.array_equal(R[j], ecliptic_to_body_matrix(spin, jd[j]))
+    print("PASS: Stacked body-frame rotation matrices")
+
+
 def test_sphere_constant_brightness():
     """A sphere should produce a constant lightcurve (no rotational variation)."""
     sphere = create_sphere_mesh(n_subdivisions=3)
@@ -128,6 +163,64 @@ def test_mesh_properties():
     print("PASS: Mesh properties")
 
 
+def test_subdivide_shares_edges():
+    """Subdivision adds one vertex per shared edge and keeps them on-edge."""
+    sphere = create_sphere_mesh(n_subdivisions=0)
+    verts, faces = _subdivide(sphere.vertices, sphere.faces, project=False)
+    # Icosahedron: 12 vertices, 30 edges, 20 faces
+    assert verts.shape == (12 + 30, 3), f"Wrong vertex count {verts.shape}"
+    assert faces.shape == (80, 3), f"Wrong face count {faces.shape}"
+    assert np.array_equal(verts[:12], sphere.vertices)
+    # Unprojected midpoints lie strictly inside the unit sphere
+    assert np.all(np.linalg.norm(verts[12:], axis=1) < 1.0)
+    # Every edge of the refined mesh is shared by exactly two faces
+    edges = np.sort(np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]],
+                                    faces[:, [2, 0]]]), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    assert np.all(counts == 2), "Refined mesh is not closed"
+
+    proj_verts, _ = _subdivide(sphere.vertices, sphere.faces)
+    assert np.allclose(np.linalg.norm(proj_verts, axis=1), 1.0, atol=1e-12)
+    print("PASS: Subdivision shares edge midpoints")
+
+
+def test_obj_round_trip():
+    """save_obj writes 1-indexed faces and 8-decimal vertices load_obj reads back."""
+    mesh = create_ellipsoid_mesh(2.0, 1.0, 0.8, n_subdivisions=1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "mesh.obj")
+        save_obj(path, mesh)
+        with open(path) as f:
+            lines = f.read().splitlines()
+        loaded = load_obj(path)
+
+    assert lines[0].startswith("#")
+    assert len(lines) == 1 + len(mesh.vertices) + len(mesh.faces)
+    v = mesh.vertices[0]
+    assert lines[1] == f"v {v[0]:.8f} {v[1]:.8f} {v[2]:.8f}"
+    assert lines[-1] == "f " + " ".join(str(i + 1) for i in mesh.faces[-1])
+    assert np.array_equal(loaded.faces, mesh.faces)
+    assert np.allclose(loaded.vertices, mesh.vertices, atol=1e-8)
+    print("PASS: OBJ save/load round trip")
+
+
+def test_obj_polygon_faces():
+    """Quad and mixed faces are fan-triangulated, never reshaped."""
+    verts = "".join(f"v {x} {y} 0.0\n" for x in range(4) for y in range(2))
+    # Three quads: 12 indices would also reshape to a (4, 3) table
+    quads = "f 1 2 4 3\nf 3 4 6 5\nf 5 6 8 7\n"
+    mesh = parse_obj(verts + quads)
+    expected = np.array([[0, 1, 3], [0, 3, 2],
+                         [2, 3, 5], [2, 5, 4],
+                         [4, 5, 7], [4, 7, 6]])
+    assert np.array_equal(mesh.faces, expected), mesh.faces
+
+    mixed = parse_obj(verts + "f 1 2 4\nf 3/1/1 4/2/2 6/3/3 5/4/4\n")
+    assert np.array_equal(mixed.faces, [[0, 1, 3], [2, 3, 5], [2, 5, 4]]), \
+        mixed.faces
+    print("PASS: OBJ polygon faces triangulated")
+
+
 def test_brightness_zero_for_back_illumination():
     """Brightness should be zero if Sun illuminates back of all facets."""
     sphere = create_sphere_mesh(n_subdivisions=2)
@@ -153,7 +246,12 @@ if __name__ == '__main__':
     print("Forward Model Tests")
     print("=" * 60)
     test_kepler_solver()
+    test_pole_separation()
+    test_body_matrices_match_single_epoch()
     test_mesh_properties()
+    test_subdivide_shares_edges()
+    test_obj_round_trip()
+    test_obj_polygon_faces()
     test_brightness_zero_for_back_illumination()
     test_sphere_constant_brightness()
     test_ellipsoid_amplitude()
@@ -3,7 +3,7 @@ Tests for genetic_solver.py
 
 Validates:
 1. Dumbbell mesh creation (non-convex shape)
-2. Fitness evaluation
+2. Fitness evaluation (scalar and batched paths agree)
 3. Mutation preserves shape topology
 4. Crossover produces valid meshes
 5. Tournament selection
@@ -23,7 +23,7 @@ from convex_solver import LightcurveData
 from genetic_solver import (
     GAConfig, GAResult, Individual,
     create_dumbbell_mesh, run_genetic_solver,
-    evaluate_fitness, mutate, crossover, tournament_select,
+    evaluate_fitness, evaluate_fitness_batch, mutate, crossover, tournament_select,
     _precompute_body_dirs_ga,
     mutate_gaussian, mutate_radial, mutate_local,
     crossover_blend, crossover_uniform,
@@ -109,6 +109,55 @@ def test_fitness_evaluation():
     print(f"PASS: fitness evaluation (true shape fitness = {fitness:.6f})")
 
 
+def test_fitness_batch_matches_scalar():
+    """Batched fitness, in one chunk or several, equals evaluate_fitness."""
+    spin = SpinState(lambda_deg=45, beta_deg=30, period_hours=6.0,
+                     jd0=2451545.0)
+    mesh = create_dumbbell_mesh(a_len=1.5, lobe_radius=0.6, n_subdivisions=1)
+    lcs = _make_synthetic_lightcurves(mesh, spin, n_lc=2, n_points=30)
+    precomputed = _precompute_body_dirs_ga(spin, lcs)
+    rng = np.random.default_rng(7)
+    batch = np.stack([mesh.vertices] +
+                     [mutate_gaussian(mesh.vertices, 0.05, rng) for _ in range(4)])
+
+    batch_fit = evaluate_fitness_batch(batch, mesh.faces, spin, lcs,
+                                       c_lambert=0.1, reg_weight=0.001,
+                                       precomputed_dirs=precomputed)
+    scalar_fit = [evaluate_fitness(v, mesh.faces, spin, lcs, c_lambert=0.1,
+                                   reg_weight=0.001, precomputed_dirs=precomputed)
+                  for v in batch]
+    assert batch_fit.shape == (5,)
+    assert np.allclose(batch_fit, scalar_fit, rtol=1e-9, atol=1e-12), \
+        f"Batch {batch_fit} != scalar {scalar_fit}"
+
+    # Chunks of 2 leave a short final chunk; rows are independent
+    chunked_fit = evaluate_fitness_batch(batch, mesh.faces, spin, lcs,
+                                         c_lambert=0.1, reg_weight=0.001,
+                                         precomputed_dirs=precomputed,
+                                         chunk_size=2)
+    assert np.allclose(chunked_fit, batch_fit, rtol=1e-12, atol=0), \
+        f"Chunked {chunked_fit} != unchunked {batch_fit}"
+    print("PASS: batched fitness matches scalar fitness")
+
+
+def test_fitness_batch_rejects_implausible():
+    """Degenerate candidates score 1e20 in both paths, sparing the others."""
+    spin = SpinState(lambda_deg=45, beta_deg=30, period_hours=6.0,
+                     jd0=2451545.0)
+    mesh = create_sphere_mesh(n_subdivisions=1)
+    lcs = _make_synthetic_lightcurves(mesh, spin, n_lc=1, n_points=20)
+    bad = mesh.vertices.copy()
+    bad[0] = np.nan
+    batch = np.stack([mesh.vertices, bad])
+
+    fit = evaluate_fitness_batch(batch, mesh.faces, spin, lcs)
+    ref = evaluate_fitness(mesh.vertices, mesh.faces, spin, lcs)
+    assert fit[1] == 1e20, f"Implausible candidate scored {fit[1]}"
+    assert evaluate_fitness(bad, mesh.faces, spin, lcs) == 1e20
+    assert np.isclose(fit[0], ref, rtol=1e-9), f"{fit[0]} != {ref}"
+    print("PASS: batched fitness rejects implausible candidates")
+
+
 # -----------------------------------------------------------------------
 # Test: mutation preserves topology
 # -----------------------------------------------------------------------
@@ -163,6 +212,9 @@ def test_tournament_selection():
     # With tournament size = 20 (all), always picks individual 0
     winner = tournament_select(pop, 20, rng)
     assert winner.fitness == 0.0
+    # A precomputed fitness vector gives the same winner
+    fitness = np.array([ind.fitness for ind in pop])
+    assert tournament_select(pop, 20, rng, fitness) is pop[0]
     print("PASS: tournament selection")
 
 
@@ -211,9 +263,9 @@ def test_ga_dumbbell_recovery():
                                 initial_mesh=seed_mesh)
 
     # Compare recovered vs ground truth
-    np.random.seed(42)
-    pts_target = sample_surface_points(target_mesh, n_points=5000)
-    pts_recovered = sample_surface_points(result.mesh, n_points=5000)
+    rng = np.random.default_rng(42)
+    pts_target = sample_surface_points(target_mesh, n_points=5000, rng=rng)
+    pts_recovered = sample_surface_points(result.mesh, n_points=5000, rng=rng)
     h_sym = symmetric_hausdorff(pts_target, pts_recovered)
     nh = normalized_hausdorff(h_sym, target_mesh)
 
@@ -236,6 +288,8 @@ if __name__ == '__main__':
     print("=" * 60)
     test_dumbbell_mesh()
     test_fitness_evaluation()
+    test_fitness_batch_matches_scalar()
+    test_fitness_batch_rejects_implausible()
     test_mutation_topology()
     test_crossover_valid()
     test_tournament_selection()
@@ -8,6 +8,7 @@ Validates:
    - Expected IoU ~ (1.0)^3 / (1.1)^3 = 0.751 (ratio of volumes)
 3. Normalized Hausdorff correctness
 4. Chamfer distance consistency
+5. Surface sampling draws from its own seeded Generator
 """
 
 import sys
@@ -26,6 +27,8 @@ from mesh_comparator import (
     volumetric_iou,
     compare_meshes,
     normalized_hausdorff,
+    _ray_z_hits_for_point,
+    _ray_z_hits_for_row,
 )
 
 np.random.seed(42)
@@ -54,9 +57,9 @@ def test_sample_surface_points_count():
 
 def test_sample_surface_points_on_sphere():
     """Points sampled from a unit sphere should lie near the surface (r ~ 1)."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     sphere = create_sphere_mesh(n_subdivisions=3)
-    pts = sample_surface_points(sphere, n_points=10000)
+    pts = sample_surface_points(sphere, n_points=10000, rng=rng)
     radii = np.linalg.norm(pts, axis=1)
     # All radii should be very close to 1.0 for a unit icosphere
     assert np.allclose(radii, 1.0, atol=0.05), \
@@ -64,15 +67,29 @@ def test_sample_surface_points_on_sphere():
     print("PASS: sampled points lie on sphere surface")
 
 
+def test_sample_surface_points_rng():
+    """An int seed is reproducible and the default leaves np.random alone."""
+    sphere = create_sphere_mesh(n_subdivisions=2)
+    assert np.array_equal(sample_surface_points(sphere, 100, rng=3),
+                          sample_surface_points(sphere, 100, rng=3))
+
+    np.random.seed(42)
+    state = np.random.get_state()[1].copy()
+    sample_surface_points(sphere, 100)
+    assert np.array_equal(np.random.get_state()[1], state), \
+        "Default sampling consumed the global np.random state"
+    print("PASS: sample_surface_points seeds its own Generator")
+
+
 # -----------------------------------------------------------------------
 # Test: identical meshes
 # -----------------------------------------------------------------------
 
 def test_identical_meshes_hausdorff_zero():
     """Hausdorff distance between a mesh and itself should be ~0."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     sphere = create_sphere_mesh(n_subdivisions=3)
-    pts = sample_surface_points(sphere, n_points=10000)
+    pts = sample_surface_points(sphere, n_points=10000, rng=rng)
     h = symmetric_hausdorff(pts, pts)
     assert h < 1e-12, f"Expected ~0 Hausdorff for identical points, got {h}"
     print("PASS: identical meshes have Hausdorff ~ 0")
@@ -101,15 +118,15 @@ def test_sphere_vs_scaled_hausdorff():
     verify that:
         0.1  <=  H_sampled  <=  0.1 * 1.05   (within 5% above)
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     sphere_1 = create_sphere_mesh(n_subdivisions=4)
     sphere_11 = _make_scaled_sphere(1.1, n_subdivisions=4)
 
     # Use mesh vertices (exact sphere points) plus dense random samples
     pts_1 = np.vstack([sphere_1.vertices,
-                        sample_surface_points(sphere_1, n_points=100000)])
+                        sample_surface_points(sphere_1, n_points=100000, rng=rng)])
     pts_11 = np.vstack([sphere_11.vertices,
-                         sample_surface_points(sphere_11, n_points=100000)])
+                         sample_surface_points(sphere_11, n_points=100000, rng=rng)])
 
     h_sym = symmetric_hausdorff(pts_1, pts_11)
     expected = 0.1
@@ -172,6 +189,26 @@ def test_compare_meshes_returns_all_keys():
     print("PASS: compare_meshes returns all expected keys")
 
 
+def test_compare_meshes_matches_point_metrics():
+    """Shared nearest-neighbour queries reproduce the standalone metrics."""
+    sphere = create_sphere_mesh(n_subdivisions=2)
+    ellipsoid = create_ellipsoid_mesh(1.5, 1.0, 0.8, n_subdivisions=2)
+    n_pts = 1000
+
+    result = compare_meshes(sphere, ellipsoid,
+                            n_surface_points=n_pts, voxel_resolution=16, rng=7)
+    rng = np.random.default_rng(7)
+    pts_a = sample_surface_points(sphere, n_pts, rng)
+    pts_b = sample_surface_points(ellipsoid, n_pts, rng)
+
+    assert result['hausdorff_ab'] == hausdorff_distance(pts_a, pts_b)
+    assert result['hausdorff_ba'] == hausdorff_distance(pts_b, pts_a)
+    assert result['hausdorff_symmetric'] == symmetric_hausdorff(pts_a, pts_b)
+    assert abs(result['chamfer_distance']
+               - chamfer_distance(pts_a, pts_b)) < 1e-12
+    print("PASS: compare_meshes matches standalone point metrics")
+
+
 # -----------------------------------------------------------------------
 # Test: normalized Hausdorff
 # -----------------------------------------------------------------------
@@ -210,11 +247,11 @@ def test_chamfer_distance_identical_zero():
 
 def test_chamfer_distance_positive():
     """Chamfer distance should be > 0 for distinct point clouds."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     sphere_1 = create_sphere_mesh(n_subdivisions=3)
     sphere_11 = _make_scaled_sphere(1.1, n_subdivisions=3)
-    pts_1 = sample_surface_points(sphere_1, n_points=5000)
-    pts_11 = sample_surface_points(sphere_11, n_points=5000)
+    pts_1 = sample_surface_points(sphere_1, n_points=5000, rng=rng)
+    pts_11 = sample_surface_points(sphere_11, n_points=5000, rng=rng)
     cd = chamfer_distance(pts_1, pts_11)
     assert cd > 0, f"Expected positive Chamfer distance, got {cd}"
     print(f"PASS: chamfer distance positive ({cd:.4f})")
@@ -245,21 +282,39 @@ def test_voxelize_sphere_volume():
     print("PASS: voxelized unit sphere volume within 10%")
 
 
+def test_ray_z_hits_row_matches_point():
+    """Row-vectorised ray casting reproduces the per-point hits."""
+    mesh = create_ellipsoid_mesh(2.0, 1.0, 0.8, n_subdivisions=2)
+    v0 = mesh.vertices[mesh.faces[:, 0]]
+    v1 = mesh.vertices[mesh.faces[:, 1]]
+    v2 = mesh.vertices[mesh.faces[:, 2]]
+    ys = np.linspace(-1.1, 1.1, 17)
+    z_row = _ray_z_hits_for_row(0.3, ys, v0, v1, v2)
+    for iy, y in enumerate(ys):
+        expected = np.sort(_ray_z_hits_for_point(0.3, y, v0, v1, v2))
+        got = np.sort(z_row[iy][np.isfinite(z_row[iy])])
+        assert np.array_equal(got, expected), f"Mismatch at y={y:.3f}"
+    print("PASS: row ray casting matches per-point ray casting")
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Mesh Comparator Tests")
     print("=" * 60)
     test_sample_surface_points_count()
     test_sample_surface_points_on_sphere()
+    test_sample_surface_points_rng()
     test_identical_meshes_hausdorff_zero()
     test_identical_meshes_iou_one()
     test_sphere_vs_scaled_hausdorff()
     test_sphere_vs_scaled_iou()
     test_compare_meshes_returns_all_keys()
+    test_compare_meshes_matches_point_metrics()
     test_normalized_hausdorff()
     test_chamfer_distance_identical_zero()
     test_chamfer_distance_positive()
     test_voxelize_sphere_volume()
+    test_ray_z_hits_row_matches_point()
     print("=" * 60)
     print("ALL TESTS PASSED")
     print("=" * 60)
@@ -5,8 +5,9 @@ Validates:
 1. H-G phase function (alpha=0 gives maximum brightness)
 2. H-G1-G2 model correctness
 3. Magnitude calibration round-trip
-4. Sparse CSV parsing
+4. Sparse CSV parsing (including Gaia position-derived geometry)
 5. Combined dense + sparse inversion recovers pole within 10 degrees
+6. Structured observation records match the dataset path
 """
 
 import sys
@@ -21,7 +22,7 @@ from sparse_handler import (
     hg_phase_function, hg12_phase_function, _phi1, _phi2, _phi3,
     calibrate_sparse_magnitudes,
     parse_gaia_sso_csv, parse_generic_sparse,
-    SparseDataset, SparseObservation,
+    SparseDataset, SparseObservation, SPARSE_OBS_DTYPE,
     create_sparse_lightcurve_data,
     combined_chi_squared, optimize_combined,
     sparse_chi_squared,
@@ -262,6 +263,66 @@ def test_parse_gaia_sso_csv():
         os.unlink(tmppath)
 
 
+def test_parse_gaia_positions():
+    """Gaia-column rows derive distances and phase angle from positions."""
+    print("Test: Parse Gaia SSO positions")
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False,
+                                     newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['observation_time', 'g_mag', 'g_flux', 'g_flux_error',
+                         'x', 'y', 'z', 'x_earth', 'y_earth', 'z_earth'])
+        # Asteroid at (2, 0, 0), Earth at (2, 1, 0): Sun and observer are
+        # 90 degrees apart as seen from the asteroid
+        writer.writerow([100.0, 15.0, 1000.0, 10.0, 2.0, 0.0, 0.0, 2.0, 1.0, 0.0])
+        writer.writerow([101.0, 15.1, 1000.0, '', 2.0, 0.0, 0.0, 2.0, 1.0, 0.0])
+        tmppath = f.name
+
+    try:
+        dataset = parse_gaia_sso_csv(tmppath)
+        assert dataset.n_obs == 1, f"Expected 1 valid observation, got {dataset.n_obs}"
+        obs = dataset.observations[0]
+        assert abs(obs.jd - (100.0 + 2455197.5)) < 1e-9
+        assert abs(obs.r_helio - 2.0) < 1e-12
+        assert abs(obs.r_geo - 1.0) < 1e-12
+        assert abs(obs.phase_angle - np.pi / 2) < 1e-12, \
+            f"Phase angle {np.degrees(obs.phase_angle):.6f} deg != 90"
+        print("PASS: Parse Gaia SSO positions")
+    finally:
+        os.unlink(tmppath)
+
+
+def test_sparse_records_match_dataset():
+    """Structured records give the same LightcurveData as the dataset."""
+    print("Test: Sparse observation records")
+
+    rng = np.random.default_rng(7)
+    n = 12
+    dataset = SparseDataset(source="test", target_id="synthetic")
+    for k in range(n):
+        dataset.observations.append(SparseObservation(
+            jd=2459000.5 + 3.7 * k, mag=15.0 + 0.1 * rng.standard_normal(),
+            mag_err=0.02 + 0.01 * rng.random(), filter_name="V",
+            phase_angle=np.radians(10.0 + k), r_helio=2.1, r_geo=1.3))
+
+    records = dataset.to_records()
+    assert records.dtype == SPARSE_OBS_DTYPE
+    assert np.array_equal(records["jd"], dataset.jd_array())
+    assert np.array_equal(records["mag_err"], dataset.mag_err_array())
+    assert np.array_equal(records["phase_angle"], dataset.phase_angle_array())
+
+    orbit = OrbitalElements(a=2.0, e=0.1, i=np.radians(10),
+                            node=np.radians(50), peri=np.radians(100),
+                            M0=np.radians(30), epoch=2451545.0)
+    spin = SpinState(lambda_deg=40.0, beta_deg=30.0, period_hours=6.0,
+                     jd0=2459000.0)
+    lc_a = create_sparse_lightcurve_data(dataset, orbit, spin)
+    lc_b = create_sparse_lightcurve_data(records, orbit, spin)
+    for attr in ("jd", "brightness", "weights", "sun_ecl", "obs_ecl"):
+        assert np.array_equal(getattr(lc_a, attr), getattr(lc_b, attr)), attr
+    print("PASS: Sparse observation records")
+
+
 # ===================================================================
 # Test 5: Integration — combined dense + sparse pole recovery
 # ===================================================================
@@ -502,6 +563,8 @@ if __name__ == '__main__':
     # Parser tests
     test_parse_generic_sparse()
     test_parse_gaia_sso_csv()
+    test_parse_gaia_positions()
+    test_sparse_records_match_dataset()
 
     # Integration test
     test_combined_pole_recovery()
@@ -0,0 +1,72 @@
+"""
+Tests for target_selector.py
+
+Validates:
+1. criteria_masks agrees with the scalar passes_priority_1..4 and
+   passes_all_criteria for every catalogue entry and at the thresholds
+2. compute_priority_scores agrees with the scalar compute_priority_score
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from target_selector import (
+    ASTEROID_DB, catalogue_table, criteria_masks, passes_priority_1,
+    passes_priority_2, passes_priority_3, passes_priority_4,
+    passes_all_criteria, compute_priority_score, compute_priority_scores
+)
+
+
+def _edge_cases():
+    """Synthetic entries sitting exactly on each criterion's threshold."""
+    base = {"neo_flag": False, "diameter_km": 100.0, "lcdb_quality": 2,
+            "in_damit": False, "num_dense_lc": 20, "num_sparse_pts": 100,
+            "num_apparitions": 3}
+    cases = [dict(base)]
+    for key, value in [("diameter_km", 100.1), ("diameter_km", 50.0),
+                       ("diameter_km", 50.1), ("neo_flag", True),
+                       ("lcdb_quality", 1), ("lcdb_quality", 3),
+                       ("in_damit", True), ("num_dense_lc", 21),
+                       ("num_sparse_pts", 101), ("num_apparitions", 4),
+                       ("num_dense_lc", 45), ("num_sparse_pts", 450)]:
+        case = dict(base)
+        case[key] = value
+        cases.append(case)
+    # Sparse branch of Priority 4 needs both conditions
+    cases.append(dict(base, num_sparse_pts=101, num_apparitions=4))
+    return cases
+
+
+def test_criteria_masks_match_scalar():
+    """Vectorised masks reproduce the per-asteroid criteria exactly."""
+    asteroids = ASTEROID_DB + _edge_cases()
+    p1, p2, p3, p4 = criteria_masks(catalogue_table(asteroids))
+    passing = p1 & p2 & p3 & p4
+    for i, ast in enumerate(asteroids):
+        assert p1[i] == passes_priority_1(ast), ast
+        assert p2[i] == passes_priority_2(ast), ast
+        assert p3[i] == passes_priority_3(ast), ast
+        assert p4[i] == passes_priority_4(ast), ast
+        assert passing[i] == passes_all_criteria(ast), ast
+    print("PASS: criteria_masks matches the scalar criteria")
+
+
+def test_priority_scores_match_scalar():
+    """Vectorised scores equal the scalar scores, list and table input alike."""
+    asteroids = ASTEROID_DB + _edge_cases()
+    expected = [compute_priority_score(ast) for ast in asteroids]
+    assert compute_priority_scores(asteroids) == expected
+    assert compute_priority_scores(catalogue_table(asteroids)) == expected
+    print("PASS: compute_priority_scores matches compute_priority_score")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("Target Selector Tests")
+    print("=" * 60)
+    test_criteria_masks_match_scalar()
+    test_priority_scores_match_scalar()
+    print("=" * 60)
+    print("ALL TESTS PASSED")
+    print("=" * 60)
@@ -6,6 +6,7 @@ Validates:
 2. Period uncertainty estimation from chi-squared landscape
 3. Shape uncertainty (vertex variance) is non-zero
 4. Coverage test: 1-sigma intervals contain true values in >= 90% of 20 trials
+5. Pooled bootstrap fits match the in-process run exactly
 """
 
 import sys
@@ -205,6 +206,28 @@ def test_coverage():
     print("PASS: bootstrap coverage >= 90%")
 
 
+# -----------------------------------------------------------------------
+# Test: pooled bootstrap matches the in-process run
+# -----------------------------------------------------------------------
+
+def test_parallel_bootstrap_matches_serial():
+    """Bootstrap results do not depend on the number of worker processes."""
+    spin = SpinState(lambda_deg=45, beta_deg=30, period_hours=6.0,
+                     jd0=2451545.0)
+    mesh = create_ellipsoid_mesh(2.0, 1.0, 0.8, n_subdivisions=1)
+    lcs = _make_synthetic_lcs(mesh, spin, n_lc=2, n_points=20,
+                               noise_sigma=0.01, seed=7)
+
+    kwargs = dict(n_bootstrap=4, n_subdivisions=1, c_lambert=0.1,
+                  reg_weight=0.01, max_iter=10, noise_sigma=0.01, seed=7)
+    serial = estimate_uncertainties(lcs, spin, max_workers=1, **kwargs)
+    pooled = estimate_uncertainties(lcs, spin, max_workers=2, **kwargs)
+
+    assert np.array_equal(serial.vertex_variance, pooled.vertex_variance)
+    assert np.array_equal(serial.pole_samples, pooled.pole_samples)
+    print("PASS: pooled bootstrap matches in-process run")
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Uncertainty Quantification Tests")
@@ -214,6 +237,7 @@ if __name__ == '__main__':
     test_period_uncertainty_landscape()
     test_shape_vertex_variance()
     test_coverage()
+    test_parallel_bootstrap_matches_serial()
     print("=" * 60)
     print("ALL TESTS PASSED")
     print("=" * 60)
@@ -10,6 +10,7 @@ References:
 """
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
@@ -61,7 +62,14 @@ def _resample_lightcurve(lc, rng):
         Resampled lightcurve.
     """
     n = len(lc.jd)
-    indices = rng.choice(n, size=n, replace=True)
+    # Uniform draw with replacement: integers() is what choice() dispatches
+    # to here, without its argument validation
+    indices = rng.integers(0, n, n)
+    return _take_lightcurve(lc, indices)
+
+
+def _take_lightcurve(lc, indices):
+    """Select the data points *indices* of a lightcurve."""
     return LightcurveData(
         jd=lc.jd[indices],
         brightness=lc.brightness[indices],
@@ -154,6 +162,90 @@ def estimate_period_uncertainty(periods, chi2_values, best_chi2=None):
     return period_sigma
 
 
+# ---------------------------------------------------------------------------
+# Bootstrap workers
+# ---------------------------------------------------------------------------
+
+def _fit_shape_fixed_spin(task):
+    """Optimise the shape for one resampled data set at a fixed spin."""
+    sphere, spin, noisy, dirs, c_lambert, reg_weight, max_iter = task
+    opt_mesh, chi2, _ = optimize_shape(
+        sphere, spin, noisy,
+        c_lambert=c_lambert, reg_weight=reg_weight,
+        max_iter=max_iter, verbose=False, precomputed_dirs=dirs
+    )
+    return opt_mesh.vertices, chi2
+
+
+def _fit_pole_and_shape(task):
+    """Run a coarse pole search, then optimise the shape at the found pole."""
+    from convex_solver import pole_search as convex_pole_search
+
+    (sphere, spin, noisy, pole_n_lambda, pole_n_beta,
+     c_lambert, reg_weight, max_iter) = task
+    best_lam, best_bet, _ = convex_pole_search(
+        sphere, spin, noisy,
+        n_lambda=pole_n_lambda, n_beta=pole_n_beta,
+        c_lambert=c_lambert, reg_weight=reg_weight,
+        opt_iter=max_iter // 2, verbose=False
+    )
+
+    trial_spin = SpinState(
+        lambda_deg=best_lam, beta_deg=best_bet,
+        period_hours=spin.period_hours, jd0=spin.jd0, phi0=spin.phi0
+    )
+
+    # Shape optimization at found pole
+    opt_mesh, chi2, _ = optimize_shape(
+        sphere, trial_spin, noisy,
+        c_lambert=c_lambert, reg_weight=reg_weight,
+        max_iter=max_iter, verbose=False
+    )
+    return best_lam, best_bet, opt_mesh.vertices, chi2
+
+
+def _summarise_samples(pole_samples, period_samples, vertex_samples):
+    """Reduce the bootstrap sample arrays to ``UncertaintyResult`` fields.
+
+    Every statistic is a whole-array reduction over the sample axis.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for :class:`UncertaintyResult` (without the
+        period landscape).
+    """
+    pole_mean = np.mean(pole_samples, axis=0)
+    pole_std = np.std(pole_samples, axis=0)
+
+    # Per-vertex variance: mean squared displacement from the mean shape
+    displacements = vertex_samples - np.mean(vertex_samples, axis=0)
+    vertex_variance = np.mean(np.einsum('bvk,bvk->bv', displacements,
+                                        displacements), axis=0)  # (N_v,)
+
+    return dict(
+        pole_lambda_mean=float(pole_mean[0]),
+        pole_beta_mean=float(pole_mean[1]),
+        pole_lambda_std=float(pole_std[0]),
+        pole_beta_std=float(pole_std[1]),
+        pole_samples=pole_samples,
+        period_mean=float(np.mean(period_samples)),
+        period_std=float(np.std(period_samples)),
+        period_samples=period_samples,
+        vertex_variance=vertex_variance,
+        vertex_std_map=np.sqrt(vertex_variance),
+    )
+
+
+def _map_bootstrap(fn, tasks, max_workers):
+    """Apply *fn* to every task in order, in a process pool unless
+    ``max_workers == 1``."""
+    if max_workers == 1:
+        return list(map(fn, tasks))
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(fn, tasks))
+
+
 # ---------------------------------------------------------------------------
 # Main bootstrap uncertainty estimation
 # ---------------------------------------------------------------------------
@@ -162,7 +254,8 @@ def estimate_uncertainties(lightcurves, spin, n_bootstrap=100,
                            n_subdivisions=1, c_lambert=0.1,
                            reg_weight=0.01, max_iter=100,
                            p_min=None, p_max=None, n_periods=50,
-                           noise_sigma=0.005, seed=42, verbose=False):
+                           noise_sigma=0.005, seed=42, verbose=False,
+                           max_workers=1):
     """Estimate uncertainties via bootstrap resampling.
 
     For each bootstrap iteration:
@@ -193,6 +286,10 @@ def estimate_uncertainties(lightcurves, spin, n_bootstrap=100,
         Gaussian noise level (fraction of mean brightness).
     seed : int
     verbose : bool
+    max_workers : int or None
+        Processes for the independent bootstrap fits.  The default 1 runs
+        them in-process; callers opt into a process pool with a larger
+        value, or None for all cores.  Results do not depend on this value.
 
     Returns
     -------
@@ -215,60 +312,45 @@ def estimate_uncertainties(lightcurves, spin, n_bootstrap=100,
         )
         period_landscape = np.column_stack([periods_arr, chi2_arr])
 
-    for i in range(n_bootstrap):
+    # The spin is fixed, so body-frame directions are computed once for the
+    # original epochs and gathered with the bootstrap indices each iteration
+    base_dirs = [_precompute_body_dirs(spin, lc) for lc in lightcurves]
+
+    # Draw every resample up front so the RNG stream does not depend on how
+    # the independent fits are scheduled
+    tasks = []
+    for _ in range(n_bootstrap):
         # Resample + add noise
-        resampled = _resample_lightcurves(lightcurves, rng)
+        indices = [rng.integers(0, len(lc.jd), len(lc.jd))
+                   for lc in lightcurves]
+        resampled = [_take_lightcurve(lc, idx)
+                     for lc, idx in zip(lightcurves, indices)]
         noisy = [_add_noise_lightcurve(lc, noise_sigma, rng) for lc in resampled]
-
-        # Optimize shape at fixed spin
-        opt_mesh, chi2, _ = optimize_shape(
-            sphere, spin, noisy,
-            c_lambert=c_lambert, reg_weight=reg_weight,
-            max_iter=max_iter, verbose=False
-        )
-
-        pole_samples[i] = [spin.lambda_deg, spin.beta_deg]
-        period_samples[i] = spin.period_hours
-        vertex_samples[i] = opt_mesh.vertices
+        dirs = [(sun_body[idx], obs_body[idx])
+                for (sun_body, obs_body), idx in zip(base_dirs, indices)]
+        tasks.append((sphere, spin, noisy, dirs, c_lambert, reg_weight, max_iter))
+
+    # Optimize shape at fixed spin
+    fits = _map_bootstrap(_fit_shape_fixed_spin, tasks, max_workers)
+    # The spin is fixed, so every pole/period sample is the same value
+    pole_samples[:] = (spin.lambda_deg, spin.beta_deg)
+    period_samples[:] = spin.period_hours
+    for i, (verts, chi2) in enumerate(fits):
+        vertex_samples[i] = verts
 
         if verbose and (i + 1) % 20 == 0:
             print(f"  Bootstrap {i+1}/{n_bootstrap}: chi2={chi2:.6f}")
 
-    # Compute statistics
-    pole_lambda_mean = np.mean(pole_samples[:, 0])
-    pole_beta_mean = np.mean(pole_samples[:, 1])
-    pole_lambda_std = np.std(pole_samples[:, 0])
-    pole_beta_std = np.std(pole_samples[:, 1])
-
-    period_mean = np.mean(period_samples)
-    period_std = np.std(period_samples)
+    summary = _summarise_samples(pole_samples, period_samples, vertex_samples)
 
     # Period uncertainty from landscape if available
     if period_landscape is not None:
         period_sigma_landscape = estimate_period_uncertainty(
             period_landscape[:, 0], period_landscape[:, 1]
         )
-        period_std = max(period_std, period_sigma_landscape)
+        summary["period_std"] = max(summary["period_std"], period_sigma_landscape)
 
-    # Per-vertex variance: mean displacement from mean shape
-    mean_shape = np.mean(vertex_samples, axis=0)  # (N_v, 3)
-    displacements = vertex_samples - mean_shape[np.newaxis, :]  # (n_boot, N_v, 3)
-    vertex_variance = np.mean(np.sum(displacements ** 2, axis=2), axis=0)  # (N_v,)
-    vertex_std_map = np.sqrt(vertex_variance)
-
-    return UncertaintyResult(
-        pole_lambda_mean=pole_lambda_mean,
-        pole_beta_mean=pole_beta_mean,
-        pole_lambda_std=pole_lambda_std,
-        pole_beta_std=pole_beta_std,
-        pole_samples=pole_samples,
-        period_mean=period_mean,
-        period_std=period_std,
-        period_samples=period_samples,
-        vertex_variance=vertex_variance,
-        vertex_std_map=vertex_std_map,
-        period_landscape=period_landscape,
-    )
+    return UncertaintyResult(period_landscape=period_landscape, **summary)
 
 
 def estimate_uncertainties_with_pole(lightcurves, spin, n_bootstrap=100,
@@ -276,7 +358,7 @@ def estimate_uncertainties_with_pole(lightcurves, spin, n_bootstrap=100,
                                       reg_weight=0.01, max_iter=50,
                                       pole_n_lambda=6, pole_n_beta=3,
                                       noise_sigma=0.005, seed=42,
-                                      verbose=False):
+                                      verbose=False, max_workers=1):
     """Estimate uncertainties including pole resampling.
 
     For each bootstrap iteration, re-runs a coarse pole search in addition
@@ -297,13 +379,15 @@ def estimate_uncertainties_with_pole(lightcurves, spin, n_bootstrap=100,
     noise_sigma : float
     seed : int
     verbose : bool
+    max_workers : int or None
+        Processes for the independent bootstrap fits.  The default 1 runs
+        them in-process; callers opt into a process pool with a larger
+        value, or None for all cores.  Results do not depend on this value.
 
     Returns
     -------
     UncertaintyResult
     """
-    from convex_solver import pole_search as convex_pole_search
-
     rng = np.random.default_rng(seed)
     sphere = create_sphere_mesh(n_subdivisions)
     n_verts = len(sphere.vertices)
@@ -312,60 +396,23 @@ def estimate_uncertainties_with_pole(lightcurves, spin, n_bootstrap=100,
     period_samples = np.zeros(n_bootstrap)
     vertex_samples = np.zeros((n_bootstrap, n_verts, 3))
 
-    for i in range(n_bootstrap):
+    tasks = []
+    for _ in range(n_bootstrap):
         resampled = _resample_lightcurves(lightcurves, rng)
         noisy = [_add_noise_lightcurve(lc, noise_sigma, rng) for lc in resampled]
+        tasks.append((sphere, spin, noisy, pole_n_lambda, pole_n_beta,
+                      c_lambert, reg_weight, max_iter))
 
-        # Coarse pole search
-        best_lam, best_bet, _ = convex_pole_search(
-            sphere, spin, noisy,
-            n_lambda=pole_n_lambda, n_beta=pole_n_beta,
-            c_lambert=c_lambert, reg_weight=reg_weight,
-            opt_iter=max_iter // 2, verbose=False
-        )
-
-        trial_spin = SpinState(
-            lambda_deg=best_lam, beta_deg=best_bet,
-            period_hours=spin.period_hours, jd0=spin.jd0, phi0=spin.phi0
-        )
-
-        # Shape optimization at found pole
-        opt_mesh, chi2, _ = optimize_shape(
-            sphere, trial_spin, noisy,
-            c_lambert=c_lambert, reg_weight=reg_weight,
-            max_iter=max_iter, verbose=False
-        )
-
-        pole_samples[i] = [best_lam, best_bet]
-        period_samples[i] = spin.period_hours
-        vertex_samples[i] = opt_mesh.vertices
+    # Coarse pole search + shape optimization, one independent fit per resample
+    fits = _map_bootstrap(_fit_pole_and_shape, tasks, max_workers)
+    period_samples[:] = spin.period_hours
+    for i, (best_lam, best_bet, verts, chi2) in enumerate(fits):
+        pole_samples[i] = (best_lam, best_bet)
+        vertex_samples[i] = verts
 
         if verbose and (i + 1) % 20 == 0:
             print(f"  Bootstrap {i+1}/{n_bootstrap}: "
                   f"pole=({best_lam:.0f},{best_bet:.0f}), chi2={chi2:.6f}")
 
-    pole_lambda_mean = np.mean(pole_samples[:, 0])
-    pole_beta_mean = np.mean(pole_samples[:, 1])
-    pole_lambda_std = np.std(pole_samples[:, 0])
-    pole_beta_std = np.std(pole_samples[:, 1])
-
-    period_mean = np.mean(period_samples)
-    period_std = np.std(period_samples)
-
-    mean_shape = np.mean(vertex_samples, axis=0)
-    displacements = vertex_samples - mean_shape[np.newaxis, :]
-    vertex_variance = np.mean(np.sum(displacements ** 2, axis=2), axis=0)
-    vertex_std_map = np.sqrt(vertex_variance)
-
     return UncertaintyResult(
-        pole_lambda_mean=pole_lambda_mean,
-        pole_beta_mean=pole_beta_mean,
-        pole_lambda_std=pole_lambda_std,
-        pole_beta_std=pole_beta_std,
-        pole_samples=pole_samples,
-        period_mean=period_mean,
-        period_std=period_std,
-        period_samples=period_samples,
-        vertex_variance=vertex_variance,
-        vertex_std_map=vertex_std_map,
-    )
+        **_summarise_samples(pole_samples, period_samples, vertex_samples))